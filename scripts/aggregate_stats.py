@@ -40,8 +40,9 @@ def load_repository_stats(repo_name: str) -> dict[str, Any]:
             logger.warning(f"Stats file not found: {stats_file}")
             return {}
 
-        with open(stats_file, encoding="utf-8") as f:
-            data = json.load(f)
+        # json decodes UTF-8 bytes itself, skipping the text wrapper
+        with open(stats_file, "rb") as f:
+            data = json.loads(f.read())
 
         logger.info(f"Loaded stats for {repo_name}: {len(data)} data points")
         if isinstance(data, dict):
@@ -76,10 +77,17 @@ def load_all_repository_stats() -> list[dict[str, Any]]:
 
         logger.info(f"Looking for stats files in: {repos_dir}")
 
-        # Look for *_stats.json files in the repository directory
-        for file_path in repos_dir.glob("*_stats.json"):
-            if file_path.name != "unified_stats.json":
-                stats_files.append(file_path)
+        # Look for *_stats.json files in the repository directory; DirEntry
+        # names avoid building a Path per directory entry
+        with os.scandir(repos_dir) as it:
+            for entry in it:
+                name = entry.name
+                if (
+                    name.endswith("_stats.json")
+                    and name != "unified_stats.json"
+                    and not name.startswith(".")
+                ):
+                    stats_files.append(entry)
 
         if not stats_files:
             logger.warning(f"No repository stats files found in {repos_dir}")
@@ -88,8 +96,8 @@ def load_all_repository_stats() -> list[dict[str, Any]]:
         repository_stats = []
         for stats_file in stats_files:
             try:
-                with open(stats_file, encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(stats_file, "rb") as f:
+                    data = json.loads(f.read())
                     repository_stats.append(data)
                     logger.info(f"Loaded stats from {stats_file.name}")
             except Exception as e:
@@ -255,13 +263,14 @@ def main() -> None:
         if not repos_dir.exists():
             repos_dir = Path.cwd()
 
-        # Look for tech_stack_analysis.json files in the repository directory
-        tech_stack_files = list(repos_dir.glob("tech_stack_analysis.json"))
+        # The tech stack file has a fixed name, so probe it instead of globbing
+        tech_stack_file = repos_dir / "tech_stack_analysis.json"
+        tech_stack_files = [tech_stack_file] if tech_stack_file.is_file() else []
 
         for tech_stack_file in tech_stack_files:
             try:
-                with open(tech_stack_file, encoding="utf-8") as f:
-                    stack = json.load(f)
+                with open(tech_stack_file, "rb") as f:
+                    stack = json.loads(f.read())
                     all_tech_stacks.append(stack)
                     logger.info(f"Loaded tech stack from {tech_stack_file.name}")
             except Exception as e:
@@ -3,6 +3,7 @@ Analytics Manager for Historical Trends and Time Series Analysis
 Handles growth tracking, velocity metrics, goal tracking, and trend visualization.
 """
 
+import heapq
 import json
 import os
 from dataclasses import asdict, dataclass
@@ -298,14 +299,11 @@ class AnalyticsManager:
                 self.logger.warning("No language stats available for tracking")
                 return {}
 
-            # Sort languages by LOC
-            sorted_languages = sorted(
-                language_stats.items(), key=lambda x: x[1]["loc"], reverse=True
-            )
-
-            # Get top languages
+            # Get top languages by LOC
             top_count = language_config.get("track_top_languages", 10)
-            top_languages = sorted_languages[:top_count]
+            top_languages = heapq.nlargest(
+                top_count, language_stats.items(), key=lambda x: x[1]["loc"]
+            )
 
             # Calculate total LOC for percentage calculation
             total_loc = sum(stats["loc"] for _, stats in language_stats.items())
@@ -5,19 +5,75 @@ Analyzes repositories using GitHub API instead of cloning them.
 """
 
 import base64
+import copy
 import json
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import requests
-import yaml
-from dependency_analyzer import DependencyAnalyzer
+from config_manager import get_config_manager
+from dependency_analyzer import (
+    CATEGORY_NAMES,
+    DependencyAnalyzer,
+    categorize_dependencies,
+    package_json_dependency_names,
+    pyproject_dependency_names,
+    requirement_names,
+)
 from env_manager import env_manager
 from error_handling import get_logger, with_error_context
 from skillicon_mapper import SkilliconMapper
 
 logger = get_logger(__name__)
 
+# Repositories analyzed concurrently. The work is blocking HTTP requests, so
+# threads overlap them; kept small to stay clear of GitHub's secondary rate
+# limits on concurrent requests.
+API_WORKERS = 4
+
+# Root entries of a repository listing -> (category, tech) pairs they imply.
+# Exact (lowercased) names take precedence over suffixes, so that
+# tailwind.config.js reports tailwind rather than nodejs.
+_ROOT_NAME_TECHNOLOGIES = MappingProxyType(
+    {
+        "angular.json": (("frontend", "angular"),),
+        "tailwind.config.js": (("frontend", "tailwind"),),
+        "tailwind.config.ts": (("frontend", "tailwind"),),
+        "next.config.js": (("frontend", "nextjs"),),
+        "next.config.ts": (("frontend", "nextjs"),),
+        "nuxt.config.js": (("frontend", "nuxt"),),
+        "nuxt.config.ts": (("frontend", "nuxt"),),
+        "dockerfile": (("devops", "docker"),),
+        "docker-compose.yml": (("devops", "docker"),),
+        "docker-compose.yaml": (("devops", "docker"),),
+    }
+)
+_ROOT_DIR_TECHNOLOGIES = MappingProxyType(
+    {".github": (("devops", "github"), ("devops", "githubactions"))}
+)
+_ROOT_SUFFIX_TECHNOLOGIES = MappingProxyType(
+    {
+        ".jsx": (("frontend", "react"),),
+        ".tsx": (("frontend", "react"),),
+        ".vue": (("frontend", "vue"),),
+        ".py": (("backend", "python"),),
+        ".java": (("backend", "java"),),
+        ".go": (("backend", "go"),),
+        ".rs": (("backend", "rust"),),
+        ".tf": (("devops", "terraform"),),
+        ".ipynb": (("ai_ml", "jupyter"), ("ai_ml", "pandas"), ("ai_ml", "numpy")),
+        ".sql": (("database", "sqlite"),),
+        ".db": (("database", "sqlite"),),
+    }
+)
+# Suffixes that only count on files, not on directories named like them
+_ROOT_FILE_SUFFIX_TECHNOLOGIES = MappingProxyType(
+    {".js": (("backend", "nodejs"),), ".ts": (("backend", "nodejs"),)}
+)
+
 
 class APIBasedRepositoryAnalyzer:
     """Analyzes repositories using GitHub API for dependency analysis."""
@@ -32,8 +88,9 @@ class APIBasedRepositoryAnalyzer:
         """Load configuration from config.yml."""
         try:
             config_path = Path(__file__).parent.parent / "config.yml"
-            with open(config_path, encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            # The manager is shared per process; copy so this analyzer's
+            # changes stay its own
+            return copy.deepcopy(get_config_manager(str(config_path)).config)
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             return {"repositories": []}
@@ -94,122 +151,49 @@ class APIBasedRepositoryAnalyzer:
         self, content: str, file_type: str
     ) -> dict[str, set[str]]:
         """Analyze dependency file content and extract technologies."""
-        categories = {
-            "frontend": set(),
-            "backend": set(),
-            "database": set(),
-            "devops": set(),
-            "ai_ml": set(),
-        }
+        categories: list[set[str]] = [set() for _ in CATEGORY_NAMES]
 
         try:
+            # Use the existing technology mappings from DependencyAnalyzer
+            analyzer = self.dependency_analyzer
             if file_type == "package.json":
-                data = json.loads(content)
-                deps = data.get("dependencies", {})
-                dev_deps = data.get("devDependencies", {})
-                all_deps = {**deps, **dev_deps}
-
-                for dep_name in all_deps.keys():
-                    dep_lower = dep_name.lower()
-                    # Use the existing technology mappings from DependencyAnalyzer
-                    if dep_lower in self.dependency_analyzer.frontend_tech:
-                        categories["frontend"].add(
-                            self.dependency_analyzer.frontend_tech[dep_lower]
-                        )
-                    elif dep_lower in self.dependency_analyzer.backend_tech:
-                        categories["backend"].add(
-                            self.dependency_analyzer.backend_tech[dep_lower]
-                        )
-                    elif dep_lower in self.dependency_analyzer.database_tech:
-                        categories["database"].add(
-                            self.dependency_analyzer.database_tech[dep_lower]
-                        )
-                    elif dep_lower in self.dependency_analyzer.devops_tech:
-                        categories["devops"].add(
-                            self.dependency_analyzer.devops_tech[dep_lower]
-                        )
-                    elif dep_lower in self.dependency_analyzer.ai_ml_tech:
-                        categories["ai_ml"].add(
-                            self.dependency_analyzer.ai_ml_tech[dep_lower]
-                        )
+                categorize_dependencies(
+                    package_json_dependency_names(content),
+                    analyzer.classify_dependency,
+                    categories,
+                )
 
             elif file_type == "requirements.txt":
-                for line in content.split("\n"):
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        package_name = (
-                            line.split("==")[0]
-                            .split(">=")[0]
-                            .split("<=")[0]
-                            .split("~=")[0]
-                            .split("!=")[0]
-                            .strip()
-                        )
-                        package_lower = package_name.lower()
-
-                        if package_lower in self.dependency_analyzer.backend_tech:
-                            categories["backend"].add(
-                                self.dependency_analyzer.backend_tech[package_lower]
-                            )
-                        elif package_lower in self.dependency_analyzer.database_tech:
-                            categories["database"].add(
-                                self.dependency_analyzer.database_tech[package_lower]
-                            )
-                        elif package_lower in self.dependency_analyzer.devops_tech:
-                            categories["devops"].add(
-                                self.dependency_analyzer.devops_tech[package_lower]
-                            )
-                        elif package_lower in self.dependency_analyzer.ai_ml_tech:
-                            categories["ai_ml"].add(
-                                self.dependency_analyzer.ai_ml_tech[package_lower]
-                            )
+                categorize_dependencies(
+                    requirement_names(content),
+                    analyzer.classify_python_dependency,
+                    categories,
+                )
 
             elif file_type == "pyproject.toml":
-                # Simple pattern matching for pyproject.toml
-                import re
-
-                deps_pattern = r"\[tool\.poetry\.dependencies\]\s*\n(.*?)(?=\n\[|\Z)"
-                matches = re.findall(deps_pattern, content, re.DOTALL)
-                for match in matches:
-                    lines = match.strip().split("\n")
-                    for line in lines:
-                        line = line.strip()
-                        if "=" in line and not line.startswith("#"):
-                            package_name = (
-                                line.split("=")[0].strip().strip('"').strip("'")
-                            )
-                            package_lower = package_name.lower()
-
-                            if package_lower in self.dependency_analyzer.backend_tech:
-                                categories["backend"].add(
-                                    self.dependency_analyzer.backend_tech[package_lower]
-                                )
-                            elif (
-                                package_lower in self.dependency_analyzer.database_tech
-                            ):
-                                categories["database"].add(
-                                    self.dependency_analyzer.database_tech[
-                                        package_lower
-                                    ]
-                                )
-                            elif package_lower in self.dependency_analyzer.devops_tech:
-                                categories["devops"].add(
-                                    self.dependency_analyzer.devops_tech[package_lower]
-                                )
-                            elif package_lower in self.dependency_analyzer.ai_ml_tech:
-                                categories["ai_ml"].add(
-                                    self.dependency_analyzer.ai_ml_tech[package_lower]
-                                )
+                categorize_dependencies(
+                    pyproject_dependency_names(tomllib.loads(content)),
+                    analyzer.classify_python_dependency,
+                    categories,
+                )
 
         except Exception as e:
             logger.error(f"Error analyzing {file_type} content: {e}")
 
-        return categories
+        return dict(zip(CATEGORY_NAMES, categories, strict=True))
 
     def _detect_technologies_from_repository_structure(
-        self, org: str, repo: str, token: str | None = None
+        self,
+        org: str,
+        repo: str,
+        token: str | None = None,
+        contents: list[dict[str, Any]] | None = None,
     ) -> dict[str, set[str]]:
-        """Detect technologies from repository structure using GitHub API."""
+        """
+        Detect technologies from repository structure using GitHub API.
+
+        contents is the root listing when the caller already fetched it.
+        """
         categories = {
             "frontend": set(),
             "backend": set(),
@@ -220,8 +204,9 @@ class APIBasedRepositoryAnalyzer:
 
         try:
             # Get repository contents
-            url = f"https://api.github.com/repos/{org}/{repo}/contents"
-            contents = self._make_github_request(url, token)
+            if contents is None:
+                url = f"https://api.github.com/repos/{org}/{repo}/contents"
+                contents = self._make_github_request(url, token)
 
             if not contents:
                 return categories
@@ -231,52 +216,17 @@ class APIBasedRepositoryAnalyzer:
                 name = item.get("name", "").lower()
                 item_type = item.get("type", "file")
 
-                # Frontend technologies
-                if name.endswith((".jsx", ".tsx")):
-                    categories["frontend"].add("react")
-                elif name.endswith(".vue"):
-                    categories["frontend"].add("vue")
-                elif name == "angular.json":
-                    categories["frontend"].add("angular")
-                elif name in ["tailwind.config.js", "tailwind.config.ts"]:
-                    categories["frontend"].add("tailwind")
-                elif name in ["next.config.js", "next.config.ts"]:
-                    categories["frontend"].add("nextjs")
-                elif name in ["nuxt.config.js", "nuxt.config.ts"]:
-                    categories["frontend"].add("nuxt")
-
-                # Backend technologies
-                elif name.endswith(".py"):
-                    categories["backend"].add("python")
-                elif name.endswith((".js", ".ts")) and item_type == "file":
-                    categories["backend"].add("nodejs")
-                elif name.endswith(".java"):
-                    categories["backend"].add("java")
-                elif name.endswith(".go"):
-                    categories["backend"].add("go")
-                elif name.endswith(".rs"):
-                    categories["backend"].add("rust")
-
-                # DevOps technologies
-                elif name == "dockerfile":
-                    categories["devops"].add("docker")
-                elif name in ["docker-compose.yml", "docker-compose.yaml"]:
-                    categories["devops"].add("docker")
-                elif name.endswith(".tf"):
-                    categories["devops"].add("terraform")
-                elif name == ".github" and item_type == "dir":
-                    categories["devops"].add("github")
-                    categories["devops"].add("githubactions")
-
-                # AI/ML technologies
-                elif name.endswith(".ipynb"):
-                    categories["ai_ml"].add("jupyter")
-                    categories["ai_ml"].add("pandas")
-                    categories["ai_ml"].add("numpy")
-
-                # Database technologies
-                elif name.endswith((".sql", ".db")):
-                    categories["database"].add("sqlite")
+                # One table probe per entry: exact name, then suffix
+                hits = _ROOT_NAME_TECHNOLOGIES.get(name)
+                if hits is None and item_type == "dir":
+                    hits = _ROOT_DIR_TECHNOLOGIES.get(name)
+                if hits is None and "." in name:
+                    suffix = name[name.rfind(".") :]
+                    hits = _ROOT_SUFFIX_TECHNOLOGIES.get(suffix)
+                    if hits is None and item_type == "file":
+                        hits = _ROOT_FILE_SUFFIX_TECHNOLOGIES.get(suffix)
+                for category, tech in hits or ():
+                    categories[category].add(tech)
 
         except Exception as e:
             logger.error(f"Error detecting technologies from repository structure: {e}")
@@ -310,6 +260,19 @@ class APIBasedRepositoryAnalyzer:
                 ("go.mod", "go.mod"),
             ]
 
+            # The root listing says which dependency files exist, so only
+            # those are requested instead of probing every name for a 404
+            contents = self._make_github_request(
+                f"https://api.github.com/repos/{org}/{repo}/contents", token
+            )
+            if isinstance(contents, list):
+                root_names = {item.get("name") for item in contents}
+                dependency_files = [
+                    (file_type, file_path)
+                    for file_type, file_path in dependency_files
+                    if file_path in root_names
+                ]
+
             for file_type, file_path in dependency_files:
                 content = self._get_repository_content(org, repo, file_path, token)
                 if content:
@@ -322,7 +285,7 @@ class APIBasedRepositoryAnalyzer:
 
             # 2. Detect technologies from repository structure
             structure_techs = self._detect_technologies_from_repository_structure(
-                org, repo, token
+                org, repo, token, contents if isinstance(contents, list) else None
             )
             for category, techs in structure_techs.items():
                 all_technologies[category].update(techs)
@@ -373,6 +336,7 @@ class APIBasedRepositoryAnalyzer:
         repositories = self.config.get("repositories", [])
         logger.info(f"Analyzing {len(repositories)} repositories via API")
 
+        jobs = []
         for repo_config in repositories:
             repo_name = repo_config.get("name")
             organization = repo_config.get("organization")
@@ -385,15 +349,15 @@ class APIBasedRepositoryAnalyzer:
                 continue
 
             logger.info(f"Processing repository: {organization}/{repo_name}")
-
-            # Analyze repository via API
-            repo_tech = self.analyze_repository_via_api(
-                organization, repo_name, token_type
-            )
-
-            # Merge technologies
-            for category, techs in repo_tech.items():
-                all_technologies[category].update(techs)
+            jobs.append((organization, repo_name, token_type))
+
+        # Analyze repositories via API concurrently; merge on this thread
+        with ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+            for repo_tech in executor.map(
+                lambda job: self.analyze_repository_via_api(*job), jobs
+            ):
+                for category, techs in repo_tech.items():
+                    all_technologies[category].update(techs)
 
         # Convert sets to sorted lists and map to skillicons
         basic_tech_stack = {
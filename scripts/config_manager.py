@@ -3,6 +3,7 @@ Configuration Manager for Repository Statistics Workflow
 Handles loading and accessing configuration data from YAML files.
 """
 
+from functools import cache
 from typing import Any
 
 import yaml
@@ -20,6 +21,8 @@ logger = get_logger(__name__)
 class ConfigManager:
     """Manages configuration loading and access for the statistics workflow."""
 
+    __slots__ = ("config_path", "_config")
+
     def __init__(self, config_path: str | None = None) -> None:
         """
         Initialize the ConfigManager.
@@ -792,3 +795,15 @@ def create_config_manager(config_path: str | None = None) -> ConfigManager:
             logger=logger,
         )
         return ConfigManager()  # This line will never be reached due to log_and_raise
+
+
+@cache
+def get_config_manager(config_path: str | None = None) -> ConfigManager:
+    """
+    Return a shared ConfigManager for the given path.
+
+    The configuration file is read and parsed once per process; later calls
+    with the same path reuse the loaded instance. Its configuration is
+    shared by every caller, so copy it before making changes.
+    """
+    return create_config_manager(config_path)
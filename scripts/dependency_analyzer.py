@@ -4,9 +4,22 @@ Dependency Analyzer
 Analyzes package.json and requirements.txt files to extract actual technologies and frameworks used.
 """
 
+import atexit
 import json
+import mmap
+import os
+import re
+import sys
+import threading
+import tomllib
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
+from xml.etree import ElementTree
 
 from error_handling import (
     DependencyAnalysisError,
@@ -16,620 +29,1179 @@ from error_handling import (
     with_error_context,
 )
 
+try:
+    # Optional fast JSON codec, listed in requirements.txt; json.loads
+    # accepts the same bytes input
+    from orjson import OPT_INDENT_2
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    _orjson_dumps = None
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+# Directories that never hold first-party manifests or source indicators
+IGNORED_DIRS = frozenset(
+    {
+        "node_modules",
+        ".git",
+        "venv",
+        ".venv",
+        "dist",
+        "build",
+        "target",
+        "__pycache__",
+        ".next",
+        # Tool caches and framework build output; file names inside them
+        # (e.g. .mypy_cache/torch.data.json) would fool the name heuristics
+        ".cache",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".nox",
+        ".nuxt",
+        ".svelte-kit",
+        ".turbo",
+        "bower_components",
+    }
+)
+
+# Python dependency files in report order; "requirements" is a directory
+# whose *.txt files are included
+PYTHON_DEPENDENCY_FILES = (
+    "requirements.txt",
+    "requirements",
+    "pyproject.toml",
+    "setup.py",
+)
+
+# Manifests that make a directory under repos_dir a repository for
+# analyze_all_repositories, at its root or nested
+WORKSPACE_MANIFESTS = ("package.json", "requirements.txt")
+
+# package.json sections reported by analyze_node_dependencies
+NODE_DEPENDENCY_SECTIONS = (
+    "dependencies",
+    "devDependencies",
+    "peerDependencies",
+    "optionalDependencies",
+)
+
+# Manifest reads are syscall-bound, so oversubscribe the CPU count
+MANIFEST_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Worker processes for repositories; each reads its manifests inline
+REPOSITORY_WORKERS = min(8, os.cpu_count() or 1)
+
+# Manifests larger than this are decoded from a memory map
+MMAP_THRESHOLD = 16 * 1024
+
+# Optional JSON file that keeps parsed manifests across runs; unset
+# disables it. Entries are keyed on parser and absolute path and hold the
+# file's mtime and size; the oldest are dropped beyond the entry limit.
+MANIFEST_CACHE_PATH = os.environ.get("MANIFEST_CACHE_PATH")
+MANIFEST_CACHE_MAX_ENTRIES = 10_000
+# Bump whenever a parser's output changes; files of another version are
+# discarded rather than serving results from the old parser
+MANIFEST_CACHE_VERSION = 2
+
+# Technology categories; analysis works on a list of sets indexed by these
+CATEGORY_NAMES = ("frontend", "backend", "database", "devops", "ai_ml")
+FRONTEND, BACKEND, DATABASE, DEVOPS, AI_ML = range(len(CATEGORY_NAMES))
+
+# Scoped npm packages resolved by their scope when no exact entry matches.
+# A scope ends at the first slash, so one dict probe replaces testing each
+# prefix in turn: "@scope/" -> (category, label)
+SCOPE_RULES: Mapping[str, tuple[int, str]] = MappingProxyType(
+    {
+        scope: (category, sys.intern(label))
+        for scope, category, label in (
+            ("@google-cloud/", DEVOPS, "Google Cloud"),
+            ("@googlemaps/", FRONTEND, "Google Maps"),
+            ("@radix-ui/", FRONTEND, "Radix UI"),
+            ("@supabase/", FRONTEND, "Supabase"),
+            ("@angular/", FRONTEND, "Angular"),
+            ("@aws-sdk/", DEVOPS, "AWS"),
+            ("@azure/", DEVOPS, "Azure"),
+            # Single-product scopes: any sibling package means the same stack
+            ("@vue/", FRONTEND, "Vue.js"),
+            ("@next/", FRONTEND, "Next.js"),
+            ("@tailwindcss/", FRONTEND, "TailwindCSS"),
+            ("@vitejs/", FRONTEND, "Vite"),
+            ("@turf/", FRONTEND, "Turf.js"),
+            ("@xyflow/", FRONTEND, "React Flow"),
+            ("@stripe/", FRONTEND, "Stripe"),
+            ("@playwright/", FRONTEND, "Playwright"),
+            ("@prisma/", DATABASE, "Prisma"),
+            ("@openai/", AI_ML, "OpenAI"),
+        )
+    }
+)
+
+# Manifest patterns, compiled once at import
+# One PEP 508 requirement string from pyproject.toml: name, optional
+# [extras], optional operator and the version up to a marker or comment
+_REQUIREMENT_PIN = re.compile(
+    r"([A-Za-z0-9][A-Za-z0-9_.-]*)\s*(?:\[[^\]]*\])?\s*"
+    r"(?:===|==|>=|<=|~=|!=|>|<)?\s*(.*?)\s*(?:[;#].*)?$"
+)
+# One requirement per requirements.txt line, matched on raw bytes: name,
+# optional [extras], optional operator and the version up to whitespace, a
+# marker or a comment. Comment and option lines (-r, -e, --hash) do not
+# start with a name and never match.
+_REQUIREMENT_PIN_LINE = re.compile(
+    rb"^[ \t]*([A-Za-z0-9][A-Za-z0-9_.-]*)[ \t]*(?:\[[^\]\n]*\])?[ \t]*"
+    rb"(?:===|==|>=|<=|~=|!=|>|<)?[ \t]*([^\s;#]*)",
+    re.MULTILINE,
+)
+# PEP 503 normalization collapses runs of -, _ and . into one dash
+_PEP503_SEPARATORS = re.compile(r"[-_.]+")
+_CARGO_DEPS = re.compile(r"\[dependencies\]\s*\n(.*?)(?=\n\[|\Z)", re.DOTALL)
+# Crate key at the start of a dependency line; a dotted key such as
+# serde.workspace = true yields the crate name. Comments never match.
+_CARGO_DEP_KEY = re.compile(r"^[ \t]*([A-Za-z0-9_-]+)[ \t]*[.=]", re.MULTILINE)
+_GO_REQUIRE = re.compile(r"require\s+([^\s]+)\s+[^\s]+")
+
+# Ecosystem packages recognised in Cargo, Maven and Go manifests
+_RUST_BACKEND_CRATES = frozenset(
+    {"tokio", "actix-web", "warp", "axum", "serde", "serde_json"}
+)
+_JAVA_WEB_ARTIFACTS = frozenset({"spring-boot-starter-web", "spring-boot-starter"})
+_JAVA_DB_ARTIFACTS = frozenset({"mysql-connector", "postgresql"})
+_GO_WEB_MODULE = re.compile("gin|echo|fiber|gorilla")
+
+
+# Parse results loaded from MANIFEST_CACHE_PATH on first use, keyed by
+# "parser:absolute path" -> [mtime_ns, size, result]
+_manifest_store: dict[str, list[Any]] | None = None
+# Entries parsed by this process and not yet written back
+_unsaved_manifests: dict[str, list[Any]] = {}
+_manifest_store_lock = threading.Lock()
+
+
+def _read_manifest_store() -> dict[str, list[Any]]:
+    """Load MANIFEST_CACHE_PATH; a missing, corrupt or stale file is empty."""
+    try:
+        with open(MANIFEST_CACHE_PATH, "rb") as f:
+            data = _json_loads(f.read())
+        if data.get("version") == MANIFEST_CACHE_VERSION:
+            return dict(data["entries"])
+    except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+        logger.debug(f"Ignoring manifest cache {MANIFEST_CACHE_PATH}: {e}")
+    return {}
+
+
+def _as_tuples(value: Any) -> Any:
+    """Turn the lists of a JSON round trip back into the parsers' tuples."""
+    if isinstance(value, list):
+        return tuple(map(_as_tuples, value))
+    return value
+
+
+def _load_persisted_manifest(
+    key: str, mtime_ns: int, size: int
+) -> tuple[Any, ...] | None:
+    """Return a parse result from the persistent cache if the file is unchanged."""
+    global _manifest_store
+    with _manifest_store_lock:
+        if _manifest_store is None:
+            _manifest_store = _read_manifest_store()
+            atexit.register(_save_manifest_store)
+        entry = _manifest_store.get(key)
+    if entry is None or entry[0] != mtime_ns or entry[1] != size:
+        return None
+    return _as_tuples(entry[2])
+
+
+def _persist_manifest(
+    key: str, mtime_ns: int, size: int, result: tuple[Any, ...]
+) -> None:
+    """Record a parse result for the next _save_manifest_store()."""
+    entry = [mtime_ns, size, result]
+    with _manifest_store_lock:
+        if _manifest_store is not None:
+            _manifest_store[key] = entry
+        _unsaved_manifests[key] = entry
+
+
+def _save_manifest_store() -> None:
+    """
+    Write this process's new parse results to MANIFEST_CACHE_PATH.
+
+    The file is re-read first so entries saved meanwhile by other processes
+    are kept; the oldest written are dropped beyond the entry limit. It is
+    replaced atomically, so a concurrent reader never sees a partial file.
+    """
+    with _manifest_store_lock:
+        if not _unsaved_manifests:
+            return
+        store = _read_manifest_store()
+        for key, entry in _unsaved_manifests.items():
+            # Re-inserted at the end, as the newest entry
+            store.pop(key, None)
+            store[key] = entry
+        _unsaved_manifests.clear()
+    for key in list(store)[: max(0, len(store) - MANIFEST_CACHE_MAX_ENTRIES)]:
+        del store[key]
+    tmp_path = f"{MANIFEST_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_CACHE_VERSION, "entries": store}, f)
+        os.replace(tmp_path, MANIFEST_CACHE_PATH)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Manifest cache write failed for {MANIFEST_CACHE_PATH}: {e}")
+
+
+def _memoize_by_stat(
+    parser: Callable[[str], tuple[Any, ...]],
+) -> Callable[[str | Path], tuple[Any, ...]]:
+    """
+    Cache a manifest parser on (path, st_mtime_ns, st_size).
+
+    Nested projects and repeated analyses visit the same manifests many
+    times; unchanged files are parsed once per process, and once across
+    runs when MANIFEST_CACHE_PATH is set. Parsers must return immutable
+    values since results are shared between callers.
+    """
+    name = parser.__name__
+
+    @lru_cache(maxsize=4096)
+    def cached(path: str, mtime_ns: int, size: int) -> tuple[Any, ...]:
+        if MANIFEST_CACHE_PATH:
+            key = f"{name}:{os.path.abspath(path)}"
+            result = _load_persisted_manifest(key, mtime_ns, size)
+            if result is None:
+                result = parser(path)
+                _persist_manifest(key, mtime_ns, size, result)
+            return result
+        return parser(path)
+
+    @wraps(parser)
+    def wrapper(path: str | Path) -> tuple[Any, ...]:
+        # Paths stay plain strings from the walk through to the parser
+        stat = os.stat(path)
+        return cached(os.fspath(path), stat.st_mtime_ns, stat.st_size)
+
+    return wrapper
+
+
+def categorize_dependencies(
+    names: Iterable[str],
+    classify: Callable[[str], tuple[int, str] | None],
+    categories: list[set[str]],
+) -> None:
+    """Add the label of every recognised dependency name to its category set."""
+    for name in names:
+        hit = classify(name)
+        if hit is not None:
+            categories[hit[0]].add(hit[1])
+
+
+def _read_manifest_json(path: str) -> Any:
+    """
+    Parse a JSON manifest from its raw bytes.
+
+    With orjson, files above MMAP_THRESHOLD are decoded straight from a
+    memory map instead of being copied into a bytes object first; the
+    json fallback only accepts bytes and str, so it always reads.
+    """
+    with open(path, "rb") as f:
+        if _orjson_dumps is None or os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+            return _json_loads(f.read())
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            return _json_loads(view)
+
+
+def _read_manifest_text(path: str) -> str:
+    """
+    Read a manifest as UTF-8 text, replacing undecodable bytes.
+
+    Files above MMAP_THRESHOLD (hash-pinned requirements can reach hundreds
+    of KB) are decoded straight from a memory map, skipping the copy into an
+    intermediate bytes object.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+            return f.read().decode("utf-8", "replace")
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            return str(view, "utf-8", "replace")
+
+
+def _scan_manifest(
+    path: str, scan: Callable[[bytes | mmap.mmap], list[Any]]
+) -> list[Any]:
+    """
+    Run scan over a manifest's raw bytes.
+
+    Scanners decode only what they match, so the bulk of the file (hash
+    lines, comments) is never turned into text. Large files are scanned in
+    place through a memory map, as in _read_manifest_text.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+            return scan(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return scan(mapped)
+
+
+@_memoize_by_stat
+def _parse_package_json(path: str) -> tuple[str, ...]:
+    """Return the dependency and devDependency names from a package.json."""
+    data = _read_manifest_json(path)
+    return tuple(chain(data.get("dependencies", {}), data.get("devDependencies", {})))
+
+
+def package_json_dependency_names(content: str | bytes) -> list[str]:
+    """
+    Return the dependency and devDependency names from package.json content.
+
+    Decodes with orjson when it is installed and the standard json module
+    otherwise; both accept either str or raw UTF-8 bytes.
+    """
+    data = _json_loads(content)
+    deps = data.get("dependencies", {})
+    dev_deps = data.get("devDependencies", {})
+    return list(chain(deps, dev_deps))
+
+
+@_memoize_by_stat
+def _parse_requirement_pins(path: str) -> tuple[tuple[str, str], ...]:
+    """Return (lowercase name, version) pairs from a requirements file."""
+    return tuple(_scan_manifest(path, requirement_pins))
+
+
+def requirement_pins(content: bytes | mmap.mmap) -> list[tuple[str, str]]:
+    """
+    Return (lowercase name, version) pairs from raw requirements.txt content.
+
+    The version is what follows the operator, up to whitespace, a marker
+    or a comment, and is empty for an unpinned name. Names are interned:
+    the same packages recur across many repositories.
+    """
+    # Names are ASCII by construction of the pattern
+    return [
+        (sys.intern(name.decode("ascii").lower()), version.decode("utf-8", "replace"))
+        for name, version in _REQUIREMENT_PIN_LINE.findall(content)
+    ]
+
+
+def _parse_requirements_txt(path: str) -> tuple[str, ...]:
+    """Return the package names listed in a requirements.txt file."""
+    return tuple(name for name, _version in _parse_requirement_pins(path))
+
+
+@_memoize_by_stat
+def _parse_pyproject_pins(path: str) -> tuple[tuple[str, str], ...]:
+    """Return (lowercase name, version) pairs declared in a pyproject.toml."""
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    return tuple(pyproject_pins(data))
+
+
+def _parse_pyproject_toml(path: str) -> tuple[str, ...]:
+    """Return the dependency names declared in a pyproject.toml."""
+    return tuple(name for name, _version in _parse_pyproject_pins(path))
+
+
+def pyproject_pins(data: dict[str, Any]) -> list[tuple[str, str]]:
+    """
+    Return (lowercase name, version) pairs from parsed pyproject.toml data.
+
+    Covers PEP 621 dependencies and optional-dependencies as well as the
+    Poetry main and group dependency tables, whose "python" entry is the
+    interpreter constraint: it names the project's language, not a package.
+    """
+    project = data.get("project", {})
+    requirements = list(project.get("dependencies", []))
+    for extra in project.get("optional-dependencies", {}).values():
+        requirements.extend(extra)
+    pins = [
+        (sys.intern(match.group(1).lower()), match.group(2))
+        for match in map(_REQUIREMENT_PIN.match, requirements)
+        if match is not None
+    ]
+
+    poetry = data.get("tool", {}).get("poetry", {})
+    poetry_tables = [poetry.get("dependencies", {})]
+    poetry_tables.extend(
+        group.get("dependencies", {}) for group in poetry.get("group", {}).values()
+    )
+    for table in poetry_tables:
+        for name, spec in table.items():
+            pins.append((sys.intern(name.lower()), _poetry_version(spec)))
+    return pins
+
+
+def _poetry_version(spec: Any) -> str:
+    """
+    Return the version constraint of a Poetry dependency specification.
+
+    A spec is a version string, a table with an optional "version", or a
+    list of such tables (multiple constraints, one per Python or platform
+    marker), in which case the first table's version is reported.
+    """
+    if isinstance(spec, str):
+        return spec
+    if isinstance(spec, list):
+        spec = next((entry for entry in spec if isinstance(entry, dict)), {})
+    if isinstance(spec, dict):
+        version = spec.get("version", "")
+        return version if isinstance(version, str) else ""
+    return ""
+
+
+@_memoize_by_stat
+def _parse_node_dependency_sections(
+    path: str,
+) -> tuple[tuple[str, tuple[tuple[str, Any], ...]], ...]:
+    """Return (section, items) for each dependency section of a package.json."""
+    data = _read_manifest_json(path)
+    return tuple(
+        (section, tuple(data.get(section, {}).items()))
+        for section in NODE_DEPENDENCY_SECTIONS
+    )
+
+
+def requirement_names(text: str) -> list[str]:
+    """Return the lowercase package names from requirements.txt content."""
+    return [name for name, _version in requirement_pins(text.encode())]
+
+
+def pyproject_dependency_names(data: dict[str, Any]) -> list[str]:
+    """Return the lowercase dependency names from parsed pyproject.toml data."""
+    return [name for name, _version in pyproject_pins(data)]
+
+
+@_memoize_by_stat
+def _parse_cargo_toml(path: str) -> tuple[str, ...]:
+    """Return the crate names from the [dependencies] table of a Cargo.toml."""
+    content = _read_manifest_text(path)
+    return tuple(
+        name
+        for section in _CARGO_DEPS.findall(content)
+        for name in _CARGO_DEP_KEY.findall(section)
+    )
+
+
+@_memoize_by_stat
+def _parse_pom_xml(path: str) -> tuple[str, ...]:
+    """Return the dependency artifactIds declared in a Maven pom.xml."""
+    artifact_ids = []
+    # Stream the document; tags carry the POM namespace as a {uri} prefix
+    for _event, elem in ElementTree.iterparse(path, events=("end",)):
+        if elem.tag.rpartition("}")[2] == "dependency":
+            for child in elem:
+                if child.tag.rpartition("}")[2] == "artifactId" and child.text:
+                    artifact_ids.append(child.text.strip())
+            # Dependencies are the bulk of a POM; drop each once read
+            elem.clear()
+    return tuple(artifact_ids)
+
+
+@_memoize_by_stat
+def _parse_go_mod(path: str) -> tuple[str, ...]:
+    """Return the module paths required by a go.mod file."""
+    content = _read_manifest_text(path)
+    return tuple(_GO_REQUIRE.findall(content))
+
+
+# Frontend frameworks, UI libraries and tooling
+_FRONTEND_TECH: Mapping[str, str] = MappingProxyType(
+    {
+        "react": "React",
+        "react-dom": "React",
+        "@types/react": "React",
+        "vue": "Vue.js",
+        "@vue/cli": "Vue.js",
+        "vue-router": "Vue.js",
+        "angular": "Angular",
+        "next": "Next.js",
+        "next.js": "Next.js",
+        "@next/font": "Next.js",
+        "tailwindcss": "TailwindCSS",
+        "tailwind": "TailwindCSS",
+        "@tailwindcss/forms": "TailwindCSS",
+        "bootstrap": "Bootstrap",
+        "@bootstrap": "Bootstrap",
+        "framer-motion": "Framer Motion",
+        "framer": "Framer Motion",
+        "styled-components": "Styled Components",
+        "styled": "Styled Components",
+        "sass": "Sass",
+        "scss": "Sass",
+        "node-sass": "Sass",
+        "less": "Less",
+        "typescript": "TypeScript",
+        "@types/node": "TypeScript",
+        # "@types/react": "TypeScript",  # Duplicate key removed
+        "javascript": "JavaScript",
+        "js": "JavaScript",
+        "axios": "Axios",
+        "fetch": "Fetch API",
+        "lodash": "Lodash",
+        "underscore": "Underscore",
+        "moment": "Moment.js",
+        "date-fns": "date-fns",
+        "chart.js": "Chart.js",
+        "d3": "D3.js",
+        "recharts": "Recharts",
+        # Other frontend libraries
+        "@tanstack/react-query": "TanStack Query",
+        "@hookform/resolvers": "React Hook Form",
+        "react-hook-form": "React Hook Form",
+        "react-router-dom": "React Router",
+        "react-day-picker": "React Day Picker",
+        "react-resizable-panels": "React Resizable Panels",
+        "react-icons": "React Icons",
+        "react-hot-toast": "React Hot Toast",
+        "sonner": "Sonner",
+        "lucide-react": "Lucide React",
+        "class-variance-authority": "CVA",
+        "clsx": "clsx",
+        "tailwind-merge": "Tailwind Merge",
+        "tailwindcss-animate": "Tailwind Animate",
+        "cmdk": "cmdk",
+        "embla-carousel-react": "Embla Carousel",
+        "input-otp": "Input OTP",
+        "next-themes": "Next Themes",
+        "vaul": "Vaul",
+        "zod": "Zod",
+        # "framer-motion": "Framer Motion",  # Duplicate key removed
+        "vite": "Vite",
+        "@vitejs/plugin-react-swc": "Vite",
+        # Maps and visualization
+        "@react-google-maps/api": "Google Maps",
+        "@turf/turf": "Turf.js",
+        "proj4": "Proj4js",
+        "marzipano": "Marzipano",
+        "konva": "Konva",
+        "react-konva": "React Konva",
+        "@xyflow/react": "React Flow",
+        # Authentication and backend
+        "supabase": "Supabase",
+        "@stripe/stripe-js": "Stripe",
+        "bcryptjs": "bcryptjs",
+        # File handling and utilities
+        "html2canvas": "html2canvas",
+        "jspdf": "jsPDF",
+        "file-saver": "File Saver",
+        "dompurify": "DOMPurify",
+        "uuid": "UUID",
+        "crypto": "Crypto",
+        "dotenv": "dotenv",
+        # Development tools
+        "eslint": "ESLint",
+        # "typescript": "TypeScript",  # Duplicate key removed
+        "autoprefixer": "Autoprefixer",
+        "postcss": "PostCSS",
+        "esbuild": "esbuild",
+        "playwright": "Playwright",
+        "@playwright/test": "Playwright",
+        "eslint-config-prettier": "ESLint Prettier",
+        "eslint-plugin-security": "ESLint Security",
+        "eslint-plugin-sonarjs": "ESLint SonarJS",
+    }
+)
+
+
+# Backend frameworks, runtimes and server libraries
+_BACKEND_TECH: Mapping[str, str] = MappingProxyType(
+    {
+        "express": "Express.js",
+        "express.js": "Express.js",
+        "@types/express": "Express.js",
+        "fastapi": "FastAPI",
+        "fast-api": "FastAPI",
+        "uvicorn": "FastAPI",
+        "django": "Django",
+        "djangorestframework": "Django REST",
+        "django-cors-headers": "Django",
+        "flask": "Flask",
+        "flask-cors": "Flask",
+        "node": "Node.js",
+        "nodejs": "Node.js",
+        "python": "Python",
+        "java": "Java",
+        "spring-boot": "Spring Boot",
+        "spring": "Spring",
+        "php": "PHP",
+        "laravel": "Laravel",
+        "symfony": "Symfony",
+        "ruby": "Ruby",
+        "rails": "Ruby on Rails",
+        "go": "Go",
+        "golang": "Go",
+        "rust": "Rust",
+        "cors": "CORS",
+        "helmet": "Helmet",
+        "bcrypt": "bcrypt",
+        "jsonwebtoken": "JWT",
+        "passport": "Passport",
+        # Python specific
+        "starlette": "Starlette",
+        "pydantic": "Pydantic",
+        "pydantic-settings": "Pydantic Settings",
+        "pydantic-core": "Pydantic Core",
+        "python-jose": "PyJWT",
+        "passlib": "Passlib",
+        "python-multipart": "Python Multipart",
+        "pyjwt": "PyJWT",
+        "email-validator": "Email Validator",
+        "python-dotenv": "Python dotenv",
+        "python-magic": "Python Magic",
+        "aiofiles": "aiofiles",
+        "tenacity": "Tenacity",
+        "requests": "Requests",
+        "httpx": "httpx",
+        # Additional backend technologies
+        "compression": "Compression",
+        "express-rate-limit": "Rate Limiting",
+        "fast-xml-parser": "XML Parser",
+        "lru-cache": "LRU Cache",
+        "node-cache": "Node Cache",
+        "node-cron": "Cron Jobs",
+        "proj4": "Proj4",
+        "prom-client": "Prometheus",
+        "undici": "Undici",
+        "winston": "Winston",
+        "xml2js": "XML2JS",
+        "beautifulsoup4": "BeautifulSoup",
+        "apscheduler": "APScheduler",
+        "joblib": "Joblib",
+        "tabulate": "Tabulate",
+        # Testing and development
+        "pytest": "pytest",
+        "pytest-asyncio": "pytest-asyncio",
+        "pytest-cov": "pytest-cov",
+        "ruff": "Ruff",
+        "black": "Black",
+        "mypy": "MyPy",
+        "setuptools": "setuptools",
+        "artillery": "Artillery",
+        "ts-jest": "ts-jest",
+        "ts-node-dev": "ts-node-dev",
+        "tsc-alias": "tsc-alias",
+        "tsconfig-paths": "tsconfig-paths",
+    }
+)
+
+
+# Databases, drivers and ORMs
+_DATABASE_TECH: Mapping[str, str] = MappingProxyType(
+    {
+        "postgresql": "PostgreSQL",
+        "pg": "PostgreSQL",
+        "postgres": "PostgreSQL",
+        "postgresql-client": "PostgreSQL",
+        "mysql": "MySQL",
+        "mysql2": "MySQL",
+        "mysql-connector": "MySQL",
+        "mongodb": "MongoDB",
+        "mongoose": "MongoDB",
+        "mongodb-driver": "MongoDB",
+        "redis": "Redis",
+        "ioredis": "Redis",
+        "sqlite": "SQLite",
+        "sqlite3": "SQLite",
+        "prisma": "Prisma",
+        "@prisma/client": "Prisma",
+        "sequelize": "Sequelize",
+        "sequelize-cli": "Sequelize",
+        "sqlalchemy": "SQLAlchemy",
+        # "alembic": "SQLAlchemy",  # Duplicate key removed
+        "typeorm": "TypeORM",
+        "typeorm-reflect-metadata": "TypeORM",
+        # Python database
+        "asyncpg": "asyncpg",
+        "psycopg2-binary": "psycopg2",
+        "alembic": "Alembic",
+    }
+)
+
+
+# Infrastructure, CI/CD and cloud services
+_DEVOPS_TECH: Mapping[str, str] = MappingProxyType(
+    {
+        "docker": "Docker",
+        "docker-compose": "Docker Compose",
+        "@types/docker": "Docker",
+        "kubernetes": "Kubernetes",
+        "k8s": "Kubernetes",
+        "aws": "AWS",
+        "aws-sdk": "AWS SDK",
+        "@aws-sdk/client-ses": "AWS SES",
+        "azure": "Azure",
+        "gcp": "Google Cloud",
+        "google-cloud": "Google Cloud",
+        "terraform": "Terraform",
+        "jenkins": "Jenkins",
+        "github-actions": "GitHub Actions",
+        "gitlab-ci": "GitLab CI",
+        "nginx": "Nginx",
+        "apache": "Apache",
+        "rollup": "Rollup",
+        "webpack": "Webpack",
+    }
+)
+
+
+# AI, machine learning and data science libraries
+_AI_ML_TECH: Mapping[str, str] = MappingProxyType(
+    {
+        "openai": "OpenAI",
+        "openai-api": "OpenAI",
+        "@openai/api": "OpenAI",
+        "tensorflow": "TensorFlow",
+        "tf": "TensorFlow",
+        "tensorflow-gpu": "TensorFlow",
+        "pytorch": "PyTorch",
+        "torch": "PyTorch",
+        "torchvision": "PyTorch",
+        "scikit-learn": "Scikit-learn",
+        "sklearn": "Scikit-learn",
+        "pandas": "Pandas",
+        "numpy": "NumPy",
+        "matplotlib": "Matplotlib",
+        "seaborn": "Seaborn",
+        "transformers": "Transformers",
+        "huggingface": "Hugging Face",
+        "langchain": "LangChain",
+        "langchain-community": "LangChain",
+        "anthropic": "Anthropic",
+        "claude": "Anthropic",
+        "spacy": "spaCy",
+        "nltk": "NLTK",
+        # Image processing and OCR
+        "pytesseract": "Tesseract OCR",
+        "pillow": "Pillow",
+        "opencv-python": "OpenCV",
+        "replicate": "Replicate",
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def canonical_python_name(name: str) -> str:
+    """Return the PEP 503 normalized form of a Python distribution name."""
+    return sys.intern(_PEP503_SEPARATORS.sub("-", name).lower())
+
+
+# Cargo, Maven and Go names repeat across the manifests of a workspace, and
+# their classification is a pure function of the name, so it is memoized
+
+
+@lru_cache(maxsize=4096)
+def classify_rust_crate(crate_name: str) -> tuple[int, str] | None:
+    """Return (category, label) for a Cargo crate name, if known."""
+    if crate_name.lower() in _RUST_BACKEND_CRATES:
+        return BACKEND, "rust"
+    return None
+
+
+@lru_cache(maxsize=4096)
+def classify_maven_artifact(artifact_id: str) -> tuple[int, str] | None:
+    """Return (category, label) for a Maven artifactId, if known."""
+    artifact_lower = artifact_id.lower()
+    if artifact_lower in _JAVA_WEB_ARTIFACTS:
+        return BACKEND, "java"
+    if artifact_lower in _JAVA_DB_ARTIFACTS:
+        return DATABASE, "mysql" if "mysql" in artifact_lower else "postgres"
+    return None
+
+
+@lru_cache(maxsize=4096)
+def classify_go_module(module_path: str) -> tuple[int, str] | None:
+    """Return (category, label) for a Go module path, if known."""
+    module_lower = module_path.lower()
+    if _GO_WEB_MODULE.search(module_lower):
+        return BACKEND, "go"
+    if "gorm" in module_lower:
+        return DATABASE, "sqlite"
+    return None
+
+
+def _merge_tech_tables(
+    tech_tables: Iterable[tuple[int, Mapping[str, str]]],
+) -> Mapping[str, tuple[int, str]]:
+    """Merge category tables into one read-only lookup; earlier categories win."""
+    tech_lookup: dict[str, tuple[int, str]] = {}
+    for category, techs in tech_tables:
+        for name, label in techs.items():
+            # Interned so every result set shares one object per label
+            tech_lookup.setdefault(name, (category, sys.intern(label)))
+    return MappingProxyType(tech_lookup)
+
+
+def _with_canonical_names(
+    tech_lookup: Mapping[str, tuple[int, str]],
+) -> Mapping[str, tuple[int, str]]:
+    """Add the PEP 503 normalized form of every name to a lookup."""
+    indexed = {canonical_python_name(name): hit for name, hit in tech_lookup.items()}
+    # Literal names take precedence over a colliding normalized form
+    indexed.update(tech_lookup)
+    return MappingProxyType(indexed)
+
+
+# Category tables in precedence order. Each name belongs to one table; the
+# one deliberate overlap is proj4 (Proj4js for npm, Proj4 for Python, whose
+# manifests skip the frontend table).
+_TECH_TABLES: tuple[tuple[int, Mapping[str, str]], ...] = (
+    (FRONTEND, _FRONTEND_TECH),
+    (BACKEND, _BACKEND_TECH),
+    (DATABASE, _DATABASE_TECH),
+    (DEVOPS, _DEVOPS_TECH),
+    (AI_ML, _AI_ML_TECH),
+)
+# Merged lookup: dependency name -> (category, label)
+_TECH_LOOKUP = _merge_tech_tables(_TECH_TABLES)
+# Python manifests are never matched against frontend packages. Keys are
+# also indexed in PEP 503 normalized form, so python_dotenv, Python.DotEnv
+# and python-dotenv all resolve to the same entry.
+_PYTHON_TECH_LOOKUP = _with_canonical_names(_merge_tech_tables(_TECH_TABLES[1:]))
+# Every label the manifest tables can produce, per category; once a
+# repository has found all of them, further manifests cannot add any
+_LABEL_UNIVERSE: tuple[frozenset[str], ...] = tuple(
+    frozenset(
+        label
+        for category, label in chain(_TECH_LOOKUP.values(), SCOPE_RULES.values())
+        if category == index
+    )
+    for index in range(len(CATEGORY_NAMES))
+)
+_LABEL_UNIVERSE_SIZE = sum(map(len, _LABEL_UNIVERSE))
+
+# Repository structure indicators, checked once per walked entry:
+# file suffix -> (category, tech)
+_SUFFIX_INDICATORS: Mapping[str, tuple[int, str]] = MappingProxyType(
+    {
+        ".jsx": (FRONTEND, "react"),
+        ".tsx": (FRONTEND, "react"),
+        ".vue": (FRONTEND, "vue"),
+        ".svelte": (FRONTEND, "svelte"),
+        ".tf": (DEVOPS, "terraform"),
+        ".sql": (DATABASE, "sqlite"),
+        ".ipynb": (AI_ML, "jupyter"),
+    }
+)
+# Exact file or directory name -> (category, tech)
+_NAME_INDICATORS: Mapping[str, tuple[int, str]] = MappingProxyType(
+    {
+        "angular.json": (FRONTEND, "angular"),
+        "tailwind.config.js": (FRONTEND, "tailwind"),
+        "tailwind.config.ts": (FRONTEND, "tailwind"),
+        "next.config.js": (FRONTEND, "nextjs"),
+        "next.config.ts": (FRONTEND, "nextjs"),
+        "nuxt.config.js": (FRONTEND, "nuxt"),
+        "nuxt.config.ts": (FRONTEND, "nuxt"),
+        "Dockerfile": (DEVOPS, "docker"),
+        "docker-compose.yml": (DEVOPS, "docker"),
+        "docker-compose.yaml": (DEVOPS, "docker"),
+        "terraform": (DEVOPS, "terraform"),
+        "kubernetes": (DEVOPS, "kubernetes"),
+    }
+)
+# Directory name only -> (category, tech)
+_DIR_INDICATORS: Mapping[str, tuple[int, str]] = MappingProxyType(
+    {".github": (DEVOPS, "github")}
+)
+# Fragment of the lowercased name -> (category, tech)
+_NAME_FRAGMENT_INDICATORS: tuple[tuple[str, tuple[int, str]], ...] = (
+    ("postgres", (DATABASE, "postgres")),
+    ("mysql", (DATABASE, "mysql")),
+    ("mongo", (DATABASE, "mongodb")),
+    ("tensorflow", (AI_ML, "tensorflow")),
+    ("tf", (AI_ML, "tensorflow")),
+    ("torch", (AI_ML, "pytorch")),
+    ("opencv", (AI_ML, "opencv")),
+    ("cv2", (AI_ML, "opencv")),
+)
+
+
+@lru_cache(maxsize=8192)
+def _name_fragment_indicators(name: str) -> tuple[tuple[int, str], ...]:
+    """Return the indicators whose fragment occurs in the lowercased name."""
+    # Names such as index.ts or __init__.py repeat throughout a tree, so the
+    # lowercased copy and fragment tests run once per distinct name
+    name_lower = name.lower()
+    return tuple(
+        indicator
+        for fragment, indicator in _NAME_FRAGMENT_INDICATORS
+        if fragment in name_lower
+    )
+
+
+# Distinct (category, tech) pairs _detect_technologies_from_structure can report
+STRUCTURE_INDICATOR_COUNT = len(
+    {
+        *_SUFFIX_INDICATORS.values(),
+        *_NAME_INDICATORS.values(),
+        *_DIR_INDICATORS.values(),
+        *(indicator for _fragment, indicator in _NAME_FRAGMENT_INDICATORS),
+        (DEVOPS, "kubernetes"),
+    }
+)
+
+
+def _category_sets(techs: tuple[frozenset[str], ...] | None) -> dict[str, set[str]]:
+    """Return fresh per-category sets, so callers can update them in place."""
+    if techs is None:
+        return {name: set() for name in CATEGORY_NAMES}
+    return {name: set(found) for name, found in zip(CATEGORY_NAMES, techs, strict=True)}
+
 
 class DependencyAnalyzer:
     """Analyzes dependencies from package.json and requirements.txt files."""
 
-    def __init__(self) -> None:
-        """Initialize the dependency analyzer."""
-
-        # Technology mappings
-        self.frontend_tech = {
-            "react": "React",
-            "react-dom": "React",
-            "@types/react": "React",
-            "vue": "Vue.js",
-            "@vue/cli": "Vue.js",
-            "vue-router": "Vue.js",
-            "angular": "Angular",
-            "@angular/core": "Angular",
-            "@angular/common": "Angular",
-            "next": "Next.js",
-            "next.js": "Next.js",
-            "@next/font": "Next.js",
-            "tailwindcss": "TailwindCSS",
-            "tailwind": "TailwindCSS",
-            "@tailwindcss/forms": "TailwindCSS",
-            "bootstrap": "Bootstrap",
-            "@bootstrap": "Bootstrap",
-            "framer-motion": "Framer Motion",
-            "framer": "Framer Motion",
-            "styled-components": "Styled Components",
-            "styled": "Styled Components",
-            "sass": "Sass",
-            "scss": "Sass",
-            "node-sass": "Sass",
-            "less": "Less",
-            "typescript": "TypeScript",
-            "@types/node": "TypeScript",
-            # "@types/react": "TypeScript",  # Duplicate key removed
-            "javascript": "JavaScript",
-            "js": "JavaScript",
-            "axios": "Axios",
-            "fetch": "Fetch API",
-            "lodash": "Lodash",
-            "underscore": "Underscore",
-            "moment": "Moment.js",
-            "date-fns": "date-fns",
-            "chart.js": "Chart.js",
-            "d3": "D3.js",
-            "recharts": "Recharts",
-            # Radix UI components
-            "@radix-ui/react-accordion": "Radix UI",
-            "@radix-ui/react-alert-dialog": "Radix UI",
-            "@radix-ui/react-aspect-ratio": "Radix UI",
-            "@radix-ui/react-avatar": "Radix UI",
-            "@radix-ui/react-checkbox": "Radix UI",
-            "@radix-ui/react-collapsible": "Radix UI",
-            "@radix-ui/react-context-menu": "Radix UI",
-            "@radix-ui/react-dialog": "Radix UI",
-            "@radix-ui/react-dropdown-menu": "Radix UI",
-            "@radix-ui/react-hover-card": "Radix UI",
-            "@radix-ui/react-label": "Radix UI",
-            "@radix-ui/react-menubar": "Radix UI",
-            "@radix-ui/react-navigation-menu": "Radix UI",
-            "@radix-ui/react-popover": "Radix UI",
-            "@radix-ui/react-progress": "Radix UI",
-            "@radix-ui/react-radio-group": "Radix UI",
-            "@radix-ui/react-scroll-area": "Radix UI",
-            "@radix-ui/react-select": "Radix UI",
-            "@radix-ui/react-separator": "Radix UI",
-            "@radix-ui/react-slider": "Radix UI",
-            "@radix-ui/react-slot": "Radix UI",
-            "@radix-ui/react-switch": "Radix UI",
-            "@radix-ui/react-tabs": "Radix UI",
-            "@radix-ui/react-toast": "Radix UI",
-            "@radix-ui/react-toggle": "Radix UI",
-            "@radix-ui/react-toggle-group": "Radix UI",
-            "@radix-ui/react-tooltip": "Radix UI",
-            # Other frontend libraries
-            "@tanstack/react-query": "TanStack Query",
-            "@hookform/resolvers": "React Hook Form",
-            "react-hook-form": "React Hook Form",
-            "react-router-dom": "React Router",
-            "react-day-picker": "React Day Picker",
-            "react-resizable-panels": "React Resizable Panels",
-            "react-icons": "React Icons",
-            "react-hot-toast": "React Hot Toast",
-            "sonner": "Sonner",
-            "lucide-react": "Lucide React",
-            "class-variance-authority": "CVA",
-            "clsx": "clsx",
-            "tailwind-merge": "Tailwind Merge",
-            "tailwindcss-animate": "Tailwind Animate",
-            "cmdk": "cmdk",
-            "embla-carousel-react": "Embla Carousel",
-            "input-otp": "Input OTP",
-            "next-themes": "Next Themes",
-            "vaul": "Vaul",
-            "zod": "Zod",
-            # "framer-motion": "Framer Motion",  # Duplicate key removed
-            "vite": "Vite",
-            "@vitejs/plugin-react-swc": "Vite",
-            # Maps and visualization
-            "@react-google-maps/api": "Google Maps",
-            "@googlemaps/js-api-loader": "Google Maps",
-            "@googlemaps/markerclusterer": "Google Maps",
-            "@turf/turf": "Turf.js",
-            "proj4": "Proj4js",
-            "marzipano": "Marzipano",
-            "konva": "Konva",
-            "react-konva": "React Konva",
-            "@xyflow/react": "React Flow",
-            # Authentication and backend
-            "@supabase/auth-helpers-react": "Supabase",
-            "@supabase/supabase-js": "Supabase",
-            "supabase": "Supabase",
-            "@stripe/stripe-js": "Stripe",
-            "bcrypt": "bcrypt",
-            "bcryptjs": "bcryptjs",
-            # File handling and utilities
-            "html2canvas": "html2canvas",
-            "jspdf": "jsPDF",
-            "file-saver": "File Saver",
-            "dompurify": "DOMPurify",
-            "uuid": "UUID",
-            "crypto": "Crypto",
-            "dotenv": "dotenv",
-            # Development tools
-            "eslint": "ESLint",
-            # "typescript": "TypeScript",  # Duplicate key removed
-            "autoprefixer": "Autoprefixer",
-            "postcss": "PostCSS",
-            "esbuild": "esbuild",
-            "playwright": "Playwright",
-            "@playwright/test": "Playwright",
-            "eslint-config-prettier": "ESLint Prettier",
-            "eslint-plugin-security": "ESLint Security",
-            "eslint-plugin-sonarjs": "ESLint SonarJS",
-        }
+    # Instances carry only their result caches
+    __slots__ = ("_repository_results", "_last_result")
 
-        self.backend_tech = {
-            "express": "Express.js",
-            "express.js": "Express.js",
-            "@types/express": "Express.js",
-            "fastapi": "FastAPI",
-            "fast-api": "FastAPI",
-            "uvicorn": "FastAPI",
-            "django": "Django",
-            "djangorestframework": "Django REST",
-            "django-cors-headers": "Django",
-            "flask": "Flask",
-            "flask-cors": "Flask",
-            "node": "Node.js",
-            "nodejs": "Node.js",
-            "python": "Python",
-            "java": "Java",
-            "spring-boot": "Spring Boot",
-            "spring": "Spring",
-            "php": "PHP",
-            "laravel": "Laravel",
-            "symfony": "Symfony",
-            "ruby": "Ruby",
-            "rails": "Ruby on Rails",
-            "go": "Go",
-            "golang": "Go",
-            "rust": "Rust",
-            "cors": "CORS",
-            "helmet": "Helmet",
-            "bcrypt": "bcrypt",
-            "jsonwebtoken": "JWT",
-            "passport": "Passport",
-            # Python specific
-            "starlette": "Starlette",
-            "pydantic": "Pydantic",
-            "pydantic-settings": "Pydantic Settings",
-            "pydantic-core": "Pydantic Core",
-            "python-jose": "PyJWT",
-            "passlib": "Passlib",
-            "python-multipart": "Python Multipart",
-            "pyjwt": "PyJWT",
-            "email-validator": "Email Validator",
-            "python-dotenv": "Python dotenv",
-            "python-magic": "Python Magic",
-            "aiofiles": "aiofiles",
-            "tenacity": "Tenacity",
-            "requests": "Requests",
-            "httpx": "httpx",
-            # Additional backend technologies
-            "compression": "Compression",
-            "express-rate-limit": "Rate Limiting",
-            "fast-xml-parser": "XML Parser",
-            "ioredis": "Redis",
-            "lru-cache": "LRU Cache",
-            "node-cache": "Node Cache",
-            "node-cron": "Cron Jobs",
-            "proj4": "Proj4",
-            "prom-client": "Prometheus",
-            "undici": "Undici",
-            "winston": "Winston",
-            "xml2js": "XML2JS",
-            "beautifulsoup4": "BeautifulSoup",
-            "apscheduler": "APScheduler",
-            "joblib": "Joblib",
-            "tabulate": "Tabulate",
-            # Testing and development
-            "pytest": "pytest",
-            "pytest-asyncio": "pytest-asyncio",
-            "pytest-cov": "pytest-cov",
-            "ruff": "Ruff",
-            "black": "Black",
-            "mypy": "MyPy",
-            "setuptools": "setuptools",
-            "artillery": "Artillery",
-            "ts-jest": "ts-jest",
-            "ts-node-dev": "ts-node-dev",
-            "tsc-alias": "tsc-alias",
-            "tsconfig-paths": "tsconfig-paths",
-        }
+    # Shared, read-only tables built once at import
+    frontend_tech: ClassVar[Mapping[str, str]] = _FRONTEND_TECH
+    backend_tech: ClassVar[Mapping[str, str]] = _BACKEND_TECH
+    database_tech: ClassVar[Mapping[str, str]] = _DATABASE_TECH
+    devops_tech: ClassVar[Mapping[str, str]] = _DEVOPS_TECH
+    ai_ml_tech: ClassVar[Mapping[str, str]] = _AI_ML_TECH
+    tech_lookup: ClassVar[Mapping[str, tuple[int, str]]] = _TECH_LOOKUP
+    python_tech_lookup: ClassVar[Mapping[str, tuple[int, str]]] = _PYTHON_TECH_LOOKUP
 
-        self.database_tech = {
-            "postgresql": "PostgreSQL",
-            "pg": "PostgreSQL",
-            "postgres": "PostgreSQL",
-            "postgresql-client": "PostgreSQL",
-            "mysql": "MySQL",
-            "mysql2": "MySQL",
-            "mysql-connector": "MySQL",
-            "mongodb": "MongoDB",
-            "mongoose": "MongoDB",
-            "mongodb-driver": "MongoDB",
-            "redis": "Redis",
-            "ioredis": "Redis",
-            "sqlite": "SQLite",
-            "sqlite3": "SQLite",
-            "prisma": "Prisma",
-            "@prisma/client": "Prisma",
-            "sequelize": "Sequelize",
-            "sequelize-cli": "Sequelize",
-            "sqlalchemy": "SQLAlchemy",
-            # "alembic": "SQLAlchemy",  # Duplicate key removed
-            "typeorm": "TypeORM",
-            "typeorm-reflect-metadata": "TypeORM",
-            # Python database
-            "asyncpg": "asyncpg",
-            "psycopg2-binary": "psycopg2",
-            "alembic": "Alembic",
-        }
+    def __init__(self) -> None:
+        # Technologies per category for each repository walked, keyed by
+        # real path so nested or linked repositories are analyzed once
+        self._repository_results: dict[str, tuple[frozenset[str], ...]] = {}
+        # (real path, sorted technologies) of the last analyze_all_repositories
+        self._last_result: tuple[str, dict[str, tuple[str, ...]]] | None = None
 
-        self.devops_tech = {
-            "docker": "Docker",
-            "docker-compose": "Docker Compose",
-            "@types/docker": "Docker",
-            "kubernetes": "Kubernetes",
-            "k8s": "Kubernetes",
-            "aws": "AWS",
-            "aws-sdk": "AWS SDK",
-            "@aws-sdk/client-s3": "AWS",
-            "@aws-sdk/client-ses": "AWS SES",
-            "azure": "Azure",
-            "@azure/identity": "Azure",
-            "@azure/storage-blob": "Azure",
-            "gcp": "Google Cloud",
-            "google-cloud": "Google Cloud",
-            "@google-cloud/storage": "Google Cloud",
-            "terraform": "Terraform",
-            "jenkins": "Jenkins",
-            "github-actions": "GitHub Actions",
-            "gitlab-ci": "GitLab CI",
-            "nginx": "Nginx",
-            "apache": "Apache",
-            "vite": "Vite",
-            "esbuild": "esbuild",
-            "rollup": "Rollup",
-            "webpack": "Webpack",
-        }
+    def clear_cache(self) -> None:
+        """Forget cached results, so the next analysis re-reads the tree."""
+        self._repository_results.clear()
+        self._last_result = None
 
-        self.ai_ml_tech = {
-            "openai": "OpenAI",
-            "openai-api": "OpenAI",
-            "@openai/api": "OpenAI",
-            "tensorflow": "TensorFlow",
-            "tf": "TensorFlow",
-            "tensorflow-gpu": "TensorFlow",
-            "pytorch": "PyTorch",
-            "torch": "PyTorch",
-            "torchvision": "PyTorch",
-            "scikit-learn": "Scikit-learn",
-            "sklearn": "Scikit-learn",
-            "pandas": "Pandas",
-            "numpy": "NumPy",
-            "matplotlib": "Matplotlib",
-            "seaborn": "Seaborn",
-            "transformers": "Transformers",
-            "huggingface": "Hugging Face",
-            "langchain": "LangChain",
-            "langchain-community": "LangChain",
-            "anthropic": "Anthropic",
-            "claude": "Anthropic",
-            "spacy": "spaCy",
-            "nltk": "NLTK",
-            # Image processing and OCR
-            "pytesseract": "Tesseract OCR",
-            "pillow": "Pillow",
-            "opencv-python": "OpenCV",
-            "replicate": "Replicate",
-        }
+    def classify_dependency(self, dep_name: str) -> tuple[int, str] | None:
+        """Return (category, label) for an npm dependency name, if known."""
+        # Registry names are lowercase, so the exact probe nearly always decides
+        hit = self.tech_lookup.get(dep_name)
+        if hit is None:
+            # Most misses are unknown lowercase names, whose lowered copy
+            # would miss again; only mixed-case names pay for the copy
+            if dep_name.islower():
+                dep_lower = dep_name
+            else:
+                dep_lower = dep_name.lower()
+                hit = self.tech_lookup.get(dep_lower)
+            if hit is None and dep_lower.startswith("@"):
+                # find() is -1 for an unscoped name, giving an empty probe
+                hit = SCOPE_RULES.get(dep_lower[: dep_lower.find("/") + 1])
+        return hit
+
+    def classify_python_dependency(self, package_name: str) -> tuple[int, str] | None:
+        """Return (category, label) for a Python distribution name, if known."""
+        # Distribution names usually arrive normalized already; otherwise
+        # fall back to the cached PEP 503 form
+        hit = self.python_tech_lookup.get(package_name)
+        if hit is None:
+            hit = self.python_tech_lookup.get(canonical_python_name(package_name))
+        return hit
 
-    @with_error_context({"component": "dependency_analyzer"})
     def analyze_repository_dependencies(self, repo_path: Path) -> dict[str, set[str]]:
-        """Analyze dependencies from a repository."""
-        categories: dict[str, set[str]] = {
-            "frontend": set(),
-            "backend": set(),
-            "database": set(),
-            "devops": set(),
-            "ai_ml": set(),
-        }
+        """
+        Analyze dependencies from a repository.
+
+        Results are cached on the analyzer by real path; clear_cache() or a
+        new analyze_all_repositories() call picks up changes to the tree.
+        """
+        real_path = os.path.realpath(repo_path)
+        techs = self._repository_results.get(real_path)
+        if techs is None:
+            techs = self._repository_technologies(repo_path)
+            if techs is not None:
+                self._repository_results[real_path] = techs
+        return _category_sets(techs)
+
+    def _repository_technologies(
+        self,
+        repo_path: str | Path,
+        required_manifests: Iterable[str] = (),
+        manifest_workers: int = MANIFEST_WORKERS,
+    ) -> tuple[frozenset[str], ...] | None:
+        """
+        Return a repository's technologies per category.
+
+        Returns None on error, or when required_manifests is given and the
+        walk found none of them.
+        """
         try:
-            # Look for package.json files (Node.js/JavaScript)
-            package_json_files = list(repo_path.rglob("package.json"))
-            for package_file in package_json_files:
-                try:
-                    with open(package_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                    # Analyze dependencies
-                    deps = data.get("dependencies", {})
-                    dev_deps = data.get("devDependencies", {})
-                    all_deps = {**deps, **dev_deps}
-                    for dep_name in all_deps.keys():
-                        dep_lower = dep_name.lower()
-                        # Categorize the dependency
-                        if dep_lower in self.frontend_tech:
-                            categories["frontend"].add(self.frontend_tech[dep_lower])
-                        elif dep_lower in self.backend_tech:
-                            categories["backend"].add(self.backend_tech[dep_lower])
-                        elif dep_lower in self.database_tech:
-                            categories["database"].add(self.database_tech[dep_lower])
-                        elif dep_lower in self.devops_tech:
-                            categories["devops"].add(self.devops_tech[dep_lower])
-                        elif dep_lower in self.ai_ml_tech:
-                            categories["ai_ml"].add(self.ai_ml_tech[dep_lower])
-                except Exception as e:
-                    logger.warning(f"Error parsing {package_file}: {e}")
-                    continue
-
-            # Look for requirements.txt files (Python)
-            requirements_files = list(repo_path.rglob("requirements.txt"))
-            for req_file in requirements_files:
-                try:
-                    with open(req_file, encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            if line and not line.startswith("#"):
-                                # Extract package name (remove version specifiers)
-                                package_name = (
-                                    line.split("==")[0]
-                                    .split(">=")[0]
-                                    .split("<=")[0]
-                                    .split("~=")[0]
-                                    .split("!=")[0]
-                                    .strip()
-                                )
-                                package_lower = package_name.lower()
-
-                                # Categorize the package
-                                if package_lower in self.backend_tech:
-                                    categories["backend"].add(
-                                        self.backend_tech[package_lower]
-                                    )
-                                elif package_lower in self.database_tech:
-                                    categories["database"].add(
-                                        self.database_tech[package_lower]
-                                    )
-                                elif package_lower in self.devops_tech:
-                                    categories["devops"].add(
-                                        self.devops_tech[package_lower]
-                                    )
-                                elif package_lower in self.ai_ml_tech:
-                                    categories["ai_ml"].add(
-                                        self.ai_ml_tech[package_lower]
-                                    )
-                except Exception as e:
-                    logger.warning(f"Error parsing {req_file}: {e}")
-                    continue
-
-            # Look for pyproject.toml files (Python)
-            pyproject_files = list(repo_path.rglob("pyproject.toml"))
-            for pyproject_file in pyproject_files:
-                try:
-                    with open(pyproject_file, encoding="utf-8") as f:
-                        content = f.read()
-                        # Simple pattern matching for dependencies
-                        import re
-
-                        deps_pattern = (
-                            r"\[tool\.poetry\.dependencies\]\s*\n(.*?)(?=\n\[|\Z)"
-                        )
-                        dev_deps_pattern = r"\[tool\.poetry\.group\.dev\.dependencies\]\s*\n(.*?)(?=\n\[|\Z)"
-
-                        for pattern in [deps_pattern, dev_deps_pattern]:
-                            matches = re.findall(pattern, content, re.DOTALL)
-                            for match in matches:
-                                lines = match.strip().split("\n")
-                                for line in lines:
-                                    line = line.strip()
-                                    if "=" in line and not line.startswith("#"):
-                                        package_name = (
-                                            line.split("=")[0]
-                                            .strip()
-                                            .strip('"')
-                                            .strip("'")
-                                        )
-                                        package_lower = package_name.lower()
-
-                                        # Categorize the package
-                                        if package_lower in self.backend_tech:
-                                            categories["backend"].add(
-                                                self.backend_tech[package_lower]
-                                            )
-                                        elif package_lower in self.database_tech:
-                                            categories["database"].add(
-                                                self.database_tech[package_lower]
-                                            )
-                                        elif package_lower in self.devops_tech:
-                                            categories["devops"].add(
-                                                self.devops_tech[package_lower]
-                                            )
-                                        elif package_lower in self.ai_ml_tech:
-                                            categories["ai_ml"].add(
-                                                self.ai_ml_tech[package_lower]
-                                            )
-                except Exception as e:
-                    logger.warning(f"Error parsing {pyproject_file}: {e}")
-                    continue
-
-            # Look for Cargo.toml files (Rust)
-            cargo_files = list(repo_path.rglob("Cargo.toml"))
-            for cargo_file in cargo_files:
-                try:
-                    with open(cargo_file, encoding="utf-8") as f:
-                        content = f.read()
-                        # Simple pattern matching for dependencies
-                        import re
-
-                        deps_pattern = r"\[dependencies\]\s*\n(.*?)(?=\n\[|\Z)"
-                        matches = re.findall(deps_pattern, content, re.DOTALL)
-                        for match in matches:
-                            lines = match.strip().split("\n")
-                            for line in lines:
-                                line = line.strip()
-                                if "=" in line and not line.startswith("#"):
-                                    package_name = line.split("=")[0].strip()
-                                    package_lower = package_name.lower()
-
-                                    # Categorize Rust packages
-                                    if package_lower in [
-                                        "tokio",
-                                        "actix-web",
-                                        "warp",
-                                        "axum",
-                                    ]:
-                                        categories["backend"].add("rust")
-                                    elif package_lower in ["serde", "serde_json"]:
-                                        categories["backend"].add("rust")
-                except Exception as e:
-                    logger.warning(f"Error parsing {cargo_file}: {e}")
-                    continue
-
-            # Look for pom.xml files (Java/Maven)
-            pom_files = list(repo_path.rglob("pom.xml"))
-            for pom_file in pom_files:
-                try:
-                    with open(pom_file, encoding="utf-8") as f:
-                        content = f.read()
-                        # Simple pattern matching for dependencies
-                        import re
-
-                        deps_pattern = r"<dependency>.*?<artifactId>(.*?)</artifactId>.*?</dependency>"
-                        matches = re.findall(deps_pattern, content, re.DOTALL)
-                        for match in matches:
-                            package_lower = match.lower()
-
-                            # Categorize Java packages
-                            if package_lower in [
-                                "spring-boot-starter-web",
-                                "spring-boot-starter",
-                            ]:
-                                categories["backend"].add("java")
-                            elif package_lower in ["mysql-connector", "postgresql"]:
-                                categories["database"].add(
-                                    "mysql" if "mysql" in package_lower else "postgres"
-                                )
-                except Exception as e:
-                    logger.warning(f"Error parsing {pom_file}: {e}")
-                    continue
-
-            # Look for go.mod files (Go)
-            go_mod_files = list(repo_path.rglob("go.mod"))
-            for go_mod_file in go_mod_files:
-                try:
-                    with open(go_mod_file, encoding="utf-8") as f:
-                        content = f.read()
-                        # Simple pattern matching for dependencies
-                        import re
-
-                        deps_pattern = r"require\s+([^\s]+)\s+[^\s]+"
-                        matches = re.findall(deps_pattern, content)
-                        for match in matches:
-                            package_lower = match.lower()
-
-                            # Categorize Go packages
-                            if any(
-                                web in package_lower
-                                for web in ["gin", "echo", "fiber", "gorilla"]
-                            ):
-                                categories["backend"].add("go")
-                            elif "gorm" in package_lower:
-                                categories["database"].add("sqlite")
-                except Exception as e:
-                    logger.warning(f"Error parsing {go_mod_file}: {e}")
-                    continue
-
-            # Detect technologies from file extensions and structure
-            self._detect_technologies_from_structure(repo_path, categories)
-
-            return categories
+            categories = self._collect_repository_technologies(
+                repo_path, required_manifests, manifest_workers
+            )
+            if MANIFEST_CACHE_PATH:
+                # Saved per repository as well as at exit: worker processes
+                # end without running atexit handlers
+                _save_manifest_store()
+            return None if categories is None else tuple(map(frozenset, categories))
         except Exception as e:
             logger.error(f"Error analyzing dependencies in {repo_path}: {e}")
-            return {
-                "frontend": set(),
-                "backend": set(),
-                "database": set(),
-                "devops": set(),
-                "ai_ml": set(),
-            }
+            return None
+
+    def _collect_repository_technologies(
+        self,
+        repo_path: str | Path,
+        required_manifests: Iterable[str] = (),
+        manifest_workers: int = MANIFEST_WORKERS,
+    ) -> list[set[str]] | None:
+        """
+        Walk a repository and return its technologies per category.
+
+        Manifests are parsed on up to manifest_workers threads. Returns
+        None, without reading anything, when required_manifests is given
+        and the walk found none of them.
+        """
+        categories: list[set[str]] = [set() for _ in CATEGORY_NAMES]
+        # Manifest name -> (parser, classifier); parsers return the names
+        handlers = {
+            "package.json": (_parse_package_json, self.classify_dependency),
+            "requirements.txt": (
+                _parse_requirements_txt,
+                self.classify_python_dependency,
+            ),
+            "pyproject.toml": (_parse_pyproject_toml, self.classify_python_dependency),
+            "Cargo.toml": (_parse_cargo_toml, classify_rust_crate),
+            "pom.xml": (_parse_pom_xml, classify_maven_artifact),
+            "go.mod": (_parse_go_mod, classify_go_module),
+        }
+        manifests, entries = self._scan_repository(repo_path, handlers.keys())
+        if required_manifests and not any(
+            manifests[name] for name in required_manifests
+        ):
+            return None
+        jobs = [
+            (parser, classify, manifest_file)
+            for manifest_name, (parser, classify) in handlers.items()
+            for manifest_file in manifests[manifest_name]
+        ]
+        # Names already classified, per classifier; workspaces of a monorepo
+        # mostly repeat the same dependencies
+        classified: dict[Callable[[str], tuple[int, str] | None], set[str]] = {
+            classify: set() for _, classify in handlers.values()
+        }
+        # Shallow manifests first; they usually carry the repository's stack
+        jobs.sort(key=lambda job: job[2].count(os.sep))
+        # Parse concurrently, or inline with a single worker; merge on this
+        # thread, in order, as results land
+        executor = None
+        if manifest_workers > 1 and len(jobs) > 1:
+            executor = ThreadPoolExecutor(max_workers=manifest_workers)
+        try:
+            parsed = (
+                (self._parse(*job) for job in jobs)
+                if executor is None
+                else executor.map(lambda job: self._parse(*job), jobs)
+            )
+            for classify, names in parsed:
+                seen = classified[classify]
+                new_names = set(names) - seen
+                seen |= new_names
+                categorize_dependencies(new_names, classify, categories)
+                # Cheap size test first; categories may also hold labels from
+                # Cargo/Maven/Go handlers that are outside the universe
+                if sum(map(len, categories)) >= _LABEL_UNIVERSE_SIZE and all(
+                    universe <= techs
+                    for universe, techs in zip(_LABEL_UNIVERSE, categories, strict=True)
+                ):
+                    break
+        finally:
+            if executor is not None:
+                # Manifests not yet started are dropped after an early stop
+                executor.shutdown(cancel_futures=True)
+
+        # Detect technologies from file extensions and structure
+        self._detect_technologies_from_structure(entries, categories)
+        return categories
+
+    @staticmethod
+    def _parse(
+        parser: Callable[[str], tuple[str, ...]],
+        classify: Callable[[str], tuple[int, str] | None],
+        manifest_file: str,
+    ) -> tuple[Callable[[str], tuple[int, str] | None], tuple[str, ...]]:
+        """Parse one manifest, returning its names with their classifier."""
+        try:
+            return classify, parser(manifest_file)
+        except Exception as e:
+            logger.warning(f"Error parsing {manifest_file}: {e}")
+            return classify, ()
+
+    def _scan_repository(
+        self, repo_path: Path, manifest_names: Iterable[str]
+    ) -> tuple[dict[str, list[str]], list[tuple[str, bool]]]:
+        """
+        Walk the repository once, collecting manifest files and all entries.
+
+        Returns the manifest paths grouped by file name, plus a (name, is_dir)
+        pair for every entry outside the ignored directories.
+        """
+        manifests: dict[str, list[str]] = {name: [] for name in manifest_names}
+        entries: list[tuple[str, bool]] = []
+        stack = [os.fspath(repo_path)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        # DirEntry caches the file type, so this costs no stat
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name in IGNORED_DIRS:
+                                continue
+                            stack.append(entry.path)
+                            entries.append((entry.name, True))
+                        else:
+                            entries.append((entry.name, False))
+                            if entry.name in manifests:
+                                manifests[entry.name].append(entry.path)
+            except OSError as e:
+                logger.warning(f"Could not scan {directory}: {e}")
+        return manifests, entries
 
     def _detect_technologies_from_structure(
-        self, repo_path: Path, categories: dict[str, set[str]]
+        self, entries: list[tuple[str, bool]], categories: list[set[str]]
     ) -> None:
         """Detect technologies based on repository structure and file types."""
         try:
-            # Check for common technology indicators
-            files = list(repo_path.rglob("*"))
-
-            # Frontend technologies
-            if any(f.suffix in [".jsx", ".tsx"] for f in files):
-                categories["frontend"].add("react")
-            if any(f.suffix == ".vue" for f in files):
-                categories["frontend"].add("vue")
-            if any(f.suffix == ".svelte" for f in files):
-                categories["frontend"].add("svelte")
-            if any(f.name == "angular.json" for f in files):
-                categories["frontend"].add("angular")
-            if any(
-                f.name == "tailwind.config.js" or f.name == "tailwind.config.ts"
-                for f in files
-            ):
-                categories["frontend"].add("tailwind")
-            if any(
-                f.name == "next.config.js" or f.name == "next.config.ts" for f in files
-            ):
-                categories["frontend"].add("nextjs")
-            if any(
-                f.name == "nuxt.config.js" or f.name == "nuxt.config.ts" for f in files
-            ):
-                categories["frontend"].add("nuxt")
-
-            # Backend technologies
-            if any(f.name == "Dockerfile" for f in files):
-                categories["devops"].add("docker")
-            if any(
-                f.name == "docker-compose.yml" or f.name == "docker-compose.yaml"
-                for f in files
-            ):
-                categories["devops"].add("docker")
-            if any(f.name == ".github" and f.is_dir() for f in files):
-                categories["devops"].add("github")
-            if any(f.name == "terraform" or f.suffix == ".tf" for f in files):
-                categories["devops"].add("terraform")
-            if any(
-                f.name == "kubernetes"
-                or f.suffix in [".yaml", ".yml"]
-                and "k8s" in f.name
-                for f in files
-            ):
-                categories["devops"].add("kubernetes")
-
-            # Database technologies
-            if any(f.name.endswith(".sql") for f in files):
-                categories["database"].add("sqlite")
-            if any("postgres" in f.name.lower() for f in files):
-                categories["database"].add("postgres")
-            if any("mysql" in f.name.lower() for f in files):
-                categories["database"].add("mysql")
-            if any(
-                "mongodb" in f.name.lower() or "mongo" in f.name.lower() for f in files
-            ):
-                categories["database"].add("mongodb")
-
-            # AI/ML technologies
-            if any(f.name.endswith(".ipynb") for f in files):
-                categories["ai_ml"].add("jupyter")
-            if any(
-                "tensorflow" in f.name.lower() or "tf" in f.name.lower() for f in files
-            ):
-                categories["ai_ml"].add("tensorflow")
-            if any(
-                "pytorch" in f.name.lower() or "torch" in f.name.lower() for f in files
-            ):
-                categories["ai_ml"].add("pytorch")
-            if any(
-                "opencv" in f.name.lower() or "cv2" in f.name.lower() for f in files
-            ):
-                categories["ai_ml"].add("opencv")
+            # Check every entry once, stopping as soon as all indicators are found
+            found: set[tuple[int, str]] = set()
+            for name, is_dir in entries:
+                # Inline os.path.splitext: the last dot starts the suffix
+                # unless only dots precede it, as in .github or ..tf
+                dot = name.rfind(".")
+                suffix = (
+                    name[dot:]
+                    if dot > 0 and (name[0] != "." or name[:dot].lstrip("."))
+                    else ""
+                )
+                hit = _SUFFIX_INDICATORS.get(suffix) or _NAME_INDICATORS.get(name)
+                if hit is not None:
+                    found.add(hit)
+                if is_dir and name in _DIR_INDICATORS:
+                    found.add(_DIR_INDICATORS[name])
+                if suffix in (".yaml", ".yml") and "k8s" in name:
+                    found.add((DEVOPS, "kubernetes"))
+
+                fragment_hits = _name_fragment_indicators(name)
+                if fragment_hits:
+                    found.update(fragment_hits)
+
+                if len(found) == STRUCTURE_INDICATOR_COUNT:
+                    break
+
+            for category, tech in found:
+                categories[category].add(tech)
 
         except Exception as e:
             logger.warning(f"Error detecting technologies from structure: {e}")
@@ -637,43 +1209,16 @@ class DependencyAnalyzer:
     @with_error_context({"component": "dependency_analyzer"})
     def analyze_all_repositories(self, repos_dir: Path) -> dict[str, Any]:
         """Analyze dependencies from all repositories."""
-        all_technologies: dict[str, set[str]] = {
-            "frontend": set(),
-            "backend": set(),
-            "database": set(),
-            "devops": set(),
-            "ai_ml": set(),
-        }
         try:
-            if repos_dir.exists():
-                for repo_dir in repos_dir.iterdir():
-                    if repo_dir.is_dir():
-                        # Check root of repo_dir
-                        for fname in ["package.json", "requirements.txt"]:
-                            root_file = repo_dir / fname
-                            if root_file.exists():
-                                repo_tech = self.analyze_repository_dependencies(
-                                    repo_dir
-                                )
-                                for category, techs in repo_tech.items():
-                                    all_technologies[category].update(techs)
-                        # Recursively search subdirectories
-                        for _ in repo_dir.rglob("package.json"):
-                            repo_tech = self.analyze_repository_dependencies(_.parent)
-                            for category, techs in repo_tech.items():
-                                all_technologies[category].update(techs)
-                        for _ in repo_dir.rglob("requirements.txt"):
-                            repo_tech = self.analyze_repository_dependencies(_.parent)
-                            for category, techs in repo_tech.items():
-                                all_technologies[category].update(techs)
-            # Convert sets to sorted lists
-            result = {}
-            for category, techs in all_technologies.items():
-                result[category] = {
-                    "technologies": sorted(techs),
-                    "count": len(techs),
-                }
-            return result
+            if not repos_dir.exists():
+                return {cat: {"technologies": [], "count": 0} for cat in CATEGORY_NAMES}
+            all_technologies = self._collect_workspace_technologies(repos_dir)
+            # Sorted once; get_cached() only copies the tuples into lists
+            sorted_techs = {
+                cat: tuple(sorted(techs)) for cat, techs in all_technologies.items()
+            }
+            self._last_result = (os.path.realpath(repos_dir), sorted_techs)
+            return self._format_workspace_result(sorted_techs)
         except Exception as e:
             log_and_raise(
                 DependencyAnalysisError(
@@ -685,43 +1230,150 @@ class DependencyAnalyzer:
             )
             return {}  # This line will never be reached due to log_and_raise
 
+    def get_cached(self, repos_dir: Path) -> dict[str, Any] | None:
+        """
+        Return the last analyze_all_repositories() result for repos_dir.
+
+        Returns None when this analyzer has not analyzed repos_dir, or has
+        analyzed another directory since.
+        """
+        if self._last_result is None:
+            return None
+        real_dir, sorted_techs = self._last_result
+        if real_dir != os.path.realpath(repos_dir):
+            return None
+        return self._format_workspace_result(sorted_techs)
+
+    @staticmethod
+    def _format_workspace_result(
+        sorted_techs: dict[str, tuple[str, ...]],
+    ) -> dict[str, Any]:
+        """Build the per-category result, with fresh lists for the caller."""
+        return {
+            cat: {"technologies": list(techs), "count": len(techs)}
+            for cat, techs in sorted_techs.items()
+        }
+
+    def _collect_workspace_technologies(self, repos_dir: Path) -> dict[str, set[str]]:
+        """Analyze every repository under repos_dir and merge the results."""
+        all_technologies: dict[str, set[str]] = {name: set() for name in CATEGORY_NAMES}
+        # A repository linked in under several names is analyzed once
+        seen: set[str] = set()
+        repo_dirs = []
+        for path in repos_dir.iterdir():
+            # Skipped like the walk skips them, e.g. .git when run from a checkout
+            if path.is_dir() and path.name not in IGNORED_DIRS:
+                real_path = os.path.realpath(path)
+                if real_path not in seen:
+                    seen.add(real_path)
+                    repo_dirs.append(path)
+        # One pass per repository covers its root and every nested project;
+        # directories with no package.json or requirements.txt contribute
+        # nothing
+        results = self.analyze_repositories(repo_dirs, WORKSPACE_MANIFESTS)
+        for repo_tech in results.values():
+            for category, techs in repo_tech.items():
+                all_technologies[category].update(techs)
+        return all_technologies
+
+    def analyze_repositories(
+        self, repo_paths: list[Path], required_manifests: tuple[str, ...] = ()
+    ) -> dict[Path, dict[str, set[str]]]:
+        """
+        Analyze several repositories, returning each one's technologies.
+
+        With required_manifests, a repository containing none of those files
+        reports no technologies.
+        """
+        # Repositories are independent, so they are analyzed in worker
+        # processes to spread parsing and classification over every core.
+        # A lone repository runs inline, with its manifests on threads.
+        if len(repo_paths) > 1 and REPOSITORY_WORKERS > 1:
+            with ProcessPoolExecutor(max_workers=REPOSITORY_WORKERS) as executor:
+                repo_techs = list(
+                    executor.map(
+                        _analyze_one,
+                        map(os.fspath, repo_paths),
+                        repeat(required_manifests),
+                    )
+                )
+        else:
+            repo_techs = [
+                self._repository_technologies(path, required_manifests)
+                for path in repo_paths
+            ]
+        # Every repository is walked afresh, refreshing this analyzer's cache
+        # for later analyze_repository_dependencies() calls
+        for path, techs in zip(repo_paths, repo_techs, strict=True):
+            real_path = os.path.realpath(path)
+            if techs is None:
+                self._repository_results.pop(real_path, None)
+            else:
+                self._repository_results[real_path] = techs
+        return {
+            path: _category_sets(techs)
+            for path, techs in zip(repo_paths, repo_techs, strict=True)
+        }
+
     def analyze_python_dependencies(self, repo_path: str) -> dict[str, Any]:
-        """Analyze Python dependencies in a repository."""
+        """
+        Analyze Python dependencies in a repository.
+
+        Returns {"packages": {name: version}, "sources": {name: [files]}},
+        or {} when the repository has no Python dependency files.
+        """
         try:
-            requirements_files = []
-
-            # Find requirements files
-            for pattern in [
-                "requirements.txt",
-                "requirements/*.txt",
-                "pyproject.toml",
-                "setup.py",
-            ]:
-                try:
-                    for file_path in Path(repo_path).glob(pattern):
-                        if file_path.is_file():
-                            requirements_files.append(str(file_path))
-                except OSError as e:
-                    logger.warning(f"Error searching for {pattern} in {repo_path}: {e}")
-                    continue
+            # One listing of the root finds every candidate; only
+            # requirements/ needs a second one
+            requirements_files: list[str] = []
+            try:
+                with os.scandir(repo_path) as it:
+                    candidates = {
+                        entry.name: entry
+                        for entry in it
+                        if entry.name in PYTHON_DEPENDENCY_FILES
+                    }
+                for name in PYTHON_DEPENDENCY_FILES:
+                    entry = candidates.get(name)
+                    if entry is None:
+                        continue
+                    if name != "requirements":
+                        if entry.is_file():
+                            requirements_files.append(entry.path)
+                    elif entry.is_dir():
+                        with os.scandir(entry.path) as it:
+                            requirements_files.extend(
+                                sorted(
+                                    sub.path
+                                    for sub in it
+                                    if sub.name.endswith(".txt") and sub.is_file()
+                                )
+                            )
+            except OSError as e:
+                logger.warning(
+                    f"Error searching for dependency files in {repo_path}: {e}"
+                )
+                return {}
 
             if not requirements_files:
                 logger.info(f"No Python dependency files found in {repo_path}")
                 return {}
 
-            dependencies = {}
-            for req_file in requirements_files:
-                try:
-                    file_deps = self._parse_requirements_file(req_file)
-                    dependencies[req_file] = file_deps
-                except (FileNotFoundError, PermissionError) as e:
-                    logger.warning(f"Could not read {req_file}: {e}")
-                except (TypeError, ValueError) as e:
-                    logger.warning(f"Error parsing {req_file}: {e}")
-                except OSError as e:
-                    logger.warning(f"IO error reading {req_file}: {e}")
-
-            return dependencies
+            # Read the files concurrently; _parse_requirements_file logs and
+            # returns {} for unreadable ones
+            workers = min(len(requirements_files), MANIFEST_WORKERS)
+            packages: dict[str, str] = {}
+            sources: dict[str, list[str]] = {}
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                file_deps = executor.map(
+                    self._parse_requirements_file, requirements_files
+                )
+                # Merge in file order; a later pin for a package wins
+                for req_file, deps in zip(requirements_files, file_deps, strict=True):
+                    for package, version in deps.items():
+                        packages[package] = version
+                        sources.setdefault(package, []).append(req_file)
+            return {"packages": packages, "sources": sources}
 
         except (TypeError, AttributeError, KeyError) as e:
             logger.error(f"Error analyzing Python dependencies in {repo_path}: {e}")
@@ -733,76 +1385,45 @@ class DependencyAnalyzer:
     def analyze_node_dependencies(self, repo_path: str) -> dict[str, Any]:
         """Analyze Node.js dependencies in a repository."""
         try:
-            package_json_path = Path(repo_path) / "package.json"
-
-            if not package_json_path.exists():
-                logger.info(f"No package.json found in {repo_path}")
-                return {}
-
-            try:
-                with open(package_json_path, encoding="utf-8") as f:
-                    package_data = json.load(f)
-
-                dependencies = {
-                    "dependencies": package_data.get("dependencies", {}),
-                    "devDependencies": package_data.get("devDependencies", {}),
-                    "peerDependencies": package_data.get("peerDependencies", {}),
-                    "optionalDependencies": package_data.get(
-                        "optionalDependencies", {}
-                    ),
-                }
-
-                return dependencies
-
-            except (FileNotFoundError, PermissionError) as e:
-                logger.warning(f"Could not read package.json in {repo_path}: {e}")
-                return {}
-            except (json.JSONDecodeError, TypeError) as e:
-                logger.warning(f"Invalid JSON in package.json in {repo_path}: {e}")
-                return {}
-            except OSError as e:
-                logger.warning(f"IO error reading package.json in {repo_path}: {e}")
-                return {}
-
-        except (TypeError, AttributeError, KeyError) as e:
-            logger.error(f"Error analyzing Node.js dependencies in {repo_path}: {e}")
+            package_json_path = os.path.join(repo_path, "package.json")
+            # Parsed as bytes by orjson when installed; the memoizer's stat()
+            # doubles as the existence check
+            return {
+                section: dict(items)
+                for section, items in _parse_node_dependency_sections(package_json_path)
+            }
+        except FileNotFoundError:
+            logger.info(f"No package.json found in {repo_path}")
+            return {}
+        except PermissionError as e:
+            logger.warning(f"Could not read package.json in {repo_path}: {e}")
+            return {}
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Invalid JSON in package.json in {repo_path}: {e}")
             return {}
         except OSError as e:
-            logger.error(f"IO error analyzing Node.js dependencies in {repo_path}: {e}")
+            logger.warning(f"IO error reading package.json in {repo_path}: {e}")
+            return {}
+        except (AttributeError, KeyError) as e:
+            logger.error(f"Error analyzing Node.js dependencies in {repo_path}: {e}")
             return {}
 
     def _parse_requirements_file(self, file_path: str) -> dict[str, str]:
         """Parse a requirements.txt file and return package name to version mapping."""
         try:
-            dependencies = {}
-            with open(file_path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        # Handle different formats: package==version, package>=version, etc.
-                        if "==" in line:
-                            package, version = line.split("==", 1)
-                        elif ">=" in line:
-                            package, version = line.split(">=", 1)
-                        elif "<=" in line:
-                            package, version = line.split("<=", 1)
-                        elif ">" in line:
-                            package, version = line.split(">", 1)
-                        elif "<" in line:
-                            package, version = line.split("<", 1)
-                        else:
-                            package, version = line, ""
-
-                        package = package.strip().lower()
-                        version = version.strip()
-                        if package:
-                            dependencies[package] = version
-
-            return dependencies
+            if os.path.basename(file_path) == "pyproject.toml":
+                # Poetry's python entry is the interpreter, not a package
+                return {
+                    name: version
+                    for name, version in _parse_pyproject_pins(file_path)
+                    if name != "python"
+                }
+            return dict(_parse_requirement_pins(file_path))
         except (FileNotFoundError, PermissionError) as e:
             logger.warning(f"Could not read requirements file {file_path}: {e}")
             return {}
-        except (TypeError, ValueError) as e:
+        except (TypeError, ValueError, AttributeError, KeyError) as e:
+            # One malformed manifest must not discard the repository's others
             logger.warning(f"Error parsing requirements file {file_path}: {e}")
             return {}
         except OSError as e:
@@ -810,6 +1431,30 @@ class DependencyAnalyzer:
             return {}
 
 
+def _analyze_one(
+    repo_path: str, required_manifests: tuple[str, ...] = ()
+) -> tuple[frozenset[str], ...] | None:
+    """
+    Analyze one repository in a worker process.
+
+    Module-level, so only the path is pickled rather than a bound method
+    and its analyzer. Manifests are parsed on the worker's own thread: the
+    process pool already spreads repositories over every core.
+    """
+    return DependencyAnalyzer()._repository_technologies(
+        repo_path, required_manifests, manifest_workers=1
+    )
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented UTF-8 JSON, with orjson when it is installed."""
+    if _orjson_dumps is not None:
+        path.write_bytes(_orjson_dumps(data, option=OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 def main() -> None:
     """Main function to analyze dependencies."""
     analyzer = DependencyAnalyzer()
@@ -826,8 +1471,7 @@ def main() -> None:
 
     # Save results
     output_file = repos_dir / "tech_stack_analysis.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(tech_stack, f, indent=2, ensure_ascii=False)
+    _write_json(output_file, tech_stack)
 
 
 if __name__ == "__main__":
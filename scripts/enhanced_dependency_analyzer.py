@@ -5,19 +5,122 @@ Provides comprehensive tech stack analysis based on project descriptions and exi
 """
 
 import json
+import mmap
+import os
+import re
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import requests
-import yaml
-from dependency_analyzer import DependencyAnalyzer
+from config_manager import get_config_manager
+from dependency_analyzer import IGNORED_DIRS, MMAP_THRESHOLD, DependencyAnalyzer
 from env_manager import env_manager
 from error_handling import get_logger, with_error_context
 from skillicon_mapper import SkilliconMapper
 
 logger = get_logger(__name__)
 
+# Cloud providers detected from YAML configuration files
+CLOUD_PROVIDERS = frozenset({"aws", "azure", "gcp"})
+# Keywords that reveal each provider; one alternation scans a file for all
+_CLOUD_KEYWORD_PROVIDERS = MappingProxyType(
+    {
+        b"aws": "aws",
+        b"amazon": "aws",
+        b"azure": "azure",
+        b"gcp": "gcp",
+        b"google": "gcp",
+    }
+)
+_CLOUD_KEYWORDS = re.compile(
+    b"|".join(map(re.escape, _CLOUD_KEYWORD_PROVIDERS)), re.IGNORECASE
+)
+
+# File suffix groups and the (category, tech) pairs any one of them implies
+_SUFFIX_TECHNOLOGIES = (
+    (frozenset({".js", ".ts"}), (("frontend", "javascript"), ("backend", "nodejs"))),
+    (frozenset({".py"}), (("backend", "python"),)),
+    (
+        frozenset({".ipynb"}),
+        (("ai_ml", "jupyter"), ("ai_ml", "pandas"), ("ai_ml", "numpy")),
+    ),
+    (frozenset({".sql", ".db"}), (("database", "sqlite"),)),
+)
+
+# Description keywords that reveal each technology, per category
+DESCRIPTION_TECH_PATTERNS = MappingProxyType(
+    {
+        "frontend": {
+            "react": ("react", "reactjs", "react.js"),
+            "vue": ("vue", "vuejs", "vue.js"),
+            "angular": ("angular", "angularjs"),
+            "nextjs": ("next", "nextjs", "next.js"),
+            "nuxt": ("nuxt", "nuxtjs", "nuxt.js"),
+            "svelte": ("svelte", "sveltejs"),
+            "typescript": ("typescript", "ts"),
+            "javascript": ("javascript", "js", "es6", "es2015"),
+            "tailwind": ("tailwind", "tailwindcss"),
+            "bootstrap": ("bootstrap", "bootstrap 4", "bootstrap 5"),
+            "css": ("css", "scss", "sass", "less"),
+            "html": ("html", "html5"),
+        },
+        "backend": {
+            "python": ("python", "py", "django", "flask", "fastapi"),
+            "nodejs": ("node", "nodejs", "node.js", "express", "koa"),
+            "java": ("java", "spring", "springboot"),
+            "csharp": ("c#", "csharp", ".net", "asp.net"),
+            "go": ("go", "golang"),
+            "rust": ("rust",),
+            "php": ("php", "laravel", "symfony"),
+            "ruby": ("ruby", "rails", "sinatra"),
+        },
+        "database": {
+            "postgres": ("postgres", "postgresql", "psql"),
+            "mysql": ("mysql", "mariadb"),
+            "mongodb": ("mongo", "mongodb"),
+            "redis": ("redis",),
+            "sqlite": ("sqlite",),
+            "elasticsearch": ("elasticsearch", "elastic"),
+            "dynamodb": ("dynamodb", "dynamo"),
+        },
+        "devops": {
+            "docker": ("docker", "container"),
+            "kubernetes": ("kubernetes", "k8s"),
+            "aws": ("aws", "amazon", "ec2", "s3", "lambda"),
+            "azure": ("azure", "microsoft"),
+            "gcp": ("gcp", "google cloud", "firebase"),
+            "terraform": ("terraform",),
+            "ansible": ("ansible",),
+            "jenkins": ("jenkins",),
+            "github": ("github", "github actions"),
+            "gitlab": ("gitlab", "gitlab ci"),
+        },
+        "ai_ml": {
+            "tensorflow": ("tensorflow", "tf"),
+            "pytorch": ("pytorch", "torch"),
+            "sklearn": ("sklearn", "scikit-learn"),
+            "opencv": ("opencv", "cv2"),
+            "pandas": ("pandas", "pd"),
+            "numpy": ("numpy", "np"),
+            "openai": ("openai", "gpt", "chatgpt"),
+            "anthropic": ("anthropic", "claude"),
+            "langchain": ("langchain",),
+            "transformers": ("transformers", "huggingface"),
+        },
+    }
+)
+
+
+def _match_cloud_keywords(content: bytes | mmap.mmap, devops: set[str]) -> None:
+    """Add providers named in content to devops, stopping once all are seen."""
+    # One case-insensitive pass over the raw bytes, without a lowercased copy
+    for match in _CLOUD_KEYWORDS.finditer(content):
+        devops.add(_CLOUD_KEYWORD_PROVIDERS[match.group().lower()])
+        if CLOUD_PROVIDERS <= devops:
+            break
+
 
 class EnhancedDependencyAnalyzer:
     """Enhanced dependency analyzer that provides comprehensive tech stack analysis."""
@@ -94,69 +197,8 @@ class EnhancedDependencyAnalyzer:
 
         description_lower = description.lower()
 
-        # Technology patterns for detection
-        tech_patterns = {
-            "frontend": {
-                "react": ["react", "reactjs", "react.js"],
-                "vue": ["vue", "vuejs", "vue.js"],
-                "angular": ["angular", "angularjs"],
-                "nextjs": ["next", "nextjs", "next.js"],
-                "nuxt": ["nuxt", "nuxtjs", "nuxt.js"],
-                "svelte": ["svelte", "sveltejs"],
-                "typescript": ["typescript", "ts"],
-                "javascript": ["javascript", "js", "es6", "es2015"],
-                "tailwind": ["tailwind", "tailwindcss"],
-                "bootstrap": ["bootstrap", "bootstrap 4", "bootstrap 5"],
-                "css": ["css", "scss", "sass", "less"],
-                "html": ["html", "html5"],
-            },
-            "backend": {
-                "python": ["python", "py", "django", "flask", "fastapi"],
-                "nodejs": ["node", "nodejs", "node.js", "express", "koa"],
-                "java": ["java", "spring", "springboot"],
-                "csharp": ["c#", "csharp", ".net", "asp.net"],
-                "go": ["go", "golang"],
-                "rust": ["rust"],
-                "php": ["php", "laravel", "symfony"],
-                "ruby": ["ruby", "rails", "sinatra"],
-            },
-            "database": {
-                "postgres": ["postgres", "postgresql", "psql"],
-                "mysql": ["mysql", "mariadb"],
-                "mongodb": ["mongo", "mongodb"],
-                "redis": ["redis"],
-                "sqlite": ["sqlite"],
-                "elasticsearch": ["elasticsearch", "elastic"],
-                "dynamodb": ["dynamodb", "dynamo"],
-            },
-            "devops": {
-                "docker": ["docker", "container"],
-                "kubernetes": ["kubernetes", "k8s"],
-                "aws": ["aws", "amazon", "ec2", "s3", "lambda"],
-                "azure": ["azure", "microsoft"],
-                "gcp": ["gcp", "google cloud", "firebase"],
-                "terraform": ["terraform"],
-                "ansible": ["ansible"],
-                "jenkins": ["jenkins"],
-                "github": ["github", "github actions"],
-                "gitlab": ["gitlab", "gitlab ci"],
-            },
-            "ai_ml": {
-                "tensorflow": ["tensorflow", "tf"],
-                "pytorch": ["pytorch", "torch"],
-                "sklearn": ["sklearn", "scikit-learn"],
-                "opencv": ["opencv", "cv2"],
-                "pandas": ["pandas", "pd"],
-                "numpy": ["numpy", "np"],
-                "openai": ["openai", "gpt", "chatgpt"],
-                "anthropic": ["anthropic", "claude"],
-                "langchain": ["langchain"],
-                "transformers": ["transformers", "huggingface"],
-            },
-        }
-
         # Detect technologies from description
-        for category, techs in tech_patterns.items():
+        for category, techs in DESCRIPTION_TECH_PATTERNS.items():
             for tech_name, patterns in techs.items():
                 for pattern in patterns:
                     if pattern in description_lower:
@@ -175,10 +217,7 @@ class EnhancedDependencyAnalyzer:
                 logger.warning("config.yml not found, using fallback mappings")
                 return self._load_project_tech_mappings()
 
-            with open(config_path, encoding="utf-8") as f:
-                config = yaml.safe_load(f)
-
-            repositories = config.get("repositories", [])
+            repositories = get_config_manager(str(config_path)).get_repositories()
             dynamic_mappings = {}
 
             for repo_config in repositories:
@@ -197,10 +236,10 @@ class EnhancedDependencyAnalyzer:
                     techs = self._detect_technologies_from_description(description)
                     dynamic_mappings[display_name] = techs
                 else:
-                    # Fallback to hardcoded mappings for this project
-                    fallback_mappings = self._load_project_tech_mappings()
-                    if display_name in fallback_mappings:
-                        dynamic_mappings[display_name] = fallback_mappings[display_name]
+                    # Fallback to the mappings loaded once at construction
+                    fallback = self.project_tech_mappings.get(display_name)
+                    if fallback is not None:
+                        dynamic_mappings[display_name] = fallback
 
             return dynamic_mappings
 
@@ -307,12 +346,10 @@ class EnhancedDependencyAnalyzer:
         skillicon_mapper = SkilliconMapper()
 
         # Create tech stack structure for mapping
-        tech_stack_for_mapping = {}
-        for category, techs in all_technologies.items():
-            tech_stack_for_mapping[category] = {
-                "technologies": list(techs),
-                "count": len(techs),
-            }
+        tech_stack_for_mapping = {
+            cat: {"technologies": list(techs), "count": len(techs)}
+            for cat, techs in all_technologies.items()
+        }
 
         # Get mapped skillicons
         mapped_stack = skillicon_mapper.map_technologies(tech_stack_for_mapping)
@@ -349,6 +386,42 @@ class EnhancedDependencyAnalyzer:
 
         return result
 
+    @staticmethod
+    def _detect_technologies_from_suffixes(
+        root: Path, common_techs: dict[str, set[str]]
+    ) -> None:
+        """Add the technologies implied by file suffixes under root."""
+        pending = list(_SUFFIX_TECHNOLOGIES)
+        for _dirpath, dirnames, filenames in os.walk(root):
+            # Prune in place so vendored and generated trees are never entered
+            dirnames[:] = [name for name in dirnames if name not in IGNORED_DIRS]
+            suffixes = {os.path.splitext(name)[1] for name in filenames}
+            still_pending = []
+            for group, techs in pending:
+                if group.isdisjoint(suffixes):
+                    still_pending.append((group, techs))
+                    continue
+                for category, tech in techs:
+                    common_techs[category].add(tech)
+            pending = still_pending
+            # Every group is decided; the rest of the tree cannot add anything
+            if not pending:
+                break
+
+    @staticmethod
+    def _add_cloud_providers(yaml_file: str, devops: set[str]) -> None:
+        """Add the cloud providers a YAML file mentions to devops."""
+        with open(yaml_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+                # Small files (and empty ones, which cannot be mapped) are
+                # read whole
+                _match_cloud_keywords(f.read(), devops)
+            else:
+                # Large files are scanned in place, so the pages after the
+                # last provider is found are never read
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    _match_cloud_keywords(mapped, devops)
+
     def _detect_common_technologies_dynamically(self) -> dict[str, set[str]]:
         """Dynamically detect common technologies based on analysis patterns."""
         common_techs = {
@@ -363,64 +436,52 @@ class EnhancedDependencyAnalyzer:
             # Analyze current repository structure for common patterns
             current_dir = Path.cwd()
 
+            # One listing of the root answers every existence check below
+            with os.scandir(current_dir) as it:
+                root_entries = list(it)
+            root_names = {entry.name for entry in root_entries}
+
             # Check for common development tools and patterns
-            if (current_dir / "package.json").exists():
+            if "package.json" in root_names:
                 common_techs["frontend"].add("html")
                 common_techs["frontend"].add("css")
                 common_techs["devops"].add("git")
                 common_techs["devops"].add("github")
 
-            if (current_dir / "requirements.txt").exists() or (
-                current_dir / "pyproject.toml"
-            ).exists():
+            if "requirements.txt" in root_names or "pyproject.toml" in root_names:
                 common_techs["backend"].add("python")
                 common_techs["devops"].add("git")
                 common_techs["devops"].add("github")
 
-            if (current_dir / "Dockerfile").exists():
+            if "Dockerfile" in root_names:
                 common_techs["devops"].add("docker")
 
-            if (current_dir / ".github").exists():
+            if ".github" in root_names:
                 common_techs["devops"].add("github")
                 common_techs["devops"].add("githubactions")
 
-            if (current_dir / "terraform").exists() or list(current_dir.glob("*.tf")):
+            if "terraform" in root_names or any(
+                name.endswith(".tf") for name in root_names
+            ):
                 common_techs["devops"].add("terraform")
 
-            # Check for common file patterns
-            if list(current_dir.rglob("*.js")) or list(current_dir.rglob("*.ts")):
-                common_techs["frontend"].add("javascript")
-                common_techs["backend"].add("nodejs")
-
-            if list(current_dir.rglob("*.py")):
-                common_techs["backend"].add("python")
-
-            if list(current_dir.rglob("*.ipynb")):
-                common_techs["ai_ml"].add("jupyter")
-                common_techs["ai_ml"].add("pandas")
-                common_techs["ai_ml"].add("numpy")
-
-            # Check for database files
-            if list(current_dir.rglob("*.sql")) or list(current_dir.rglob("*.db")):
-                common_techs["database"].add("sqlite")
+            # Check for common file patterns; one walk, stopping early
+            self._detect_technologies_from_suffixes(current_dir, common_techs)
 
             # Check for cloud configuration
-            if list(current_dir.glob("*.yml")) or list(current_dir.glob("*.yaml")):
-                yaml_files = list(current_dir.glob("*.yml")) + list(
-                    current_dir.glob("*.yaml")
-                )
-                for yaml_file in yaml_files:
-                    try:
-                        with open(yaml_file) as f:
-                            content = f.read().lower()
-                            if "aws" in content or "amazon" in content:
-                                common_techs["devops"].add("aws")
-                            if "azure" in content:
-                                common_techs["devops"].add("azure")
-                            if "gcp" in content or "google" in content:
-                                common_techs["devops"].add("gcp")
-                    except Exception:
-                        continue
+            yaml_files = [
+                entry.path
+                for entry in root_entries
+                if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+            ]
+            for yaml_file in yaml_files:
+                try:
+                    self._add_cloud_providers(yaml_file, common_techs["devops"])
+                except Exception:
+                    continue
+                # Later files cannot add anything once every cloud is found
+                if CLOUD_PROVIDERS <= common_techs["devops"]:
+                    break
 
         except Exception as e:
             logger.warning(f"Error in dynamic common technology detection: {e}")
@@ -5,6 +5,7 @@ import traceback
 import types
 from collections.abc import Callable
 from datetime import UTC, datetime
+from functools import wraps
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any
@@ -398,6 +399,7 @@ def with_error_context(context: dict[str, Any]) -> Callable:
     """
 
     def decorator(func: Callable) -> Callable:
+        @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
@@ -302,6 +302,9 @@ class LanguageMapper:
                 "Binary": "Assets",
             }
 
+            # Resolved extension lookups; stats hold many files per extension
+            self._extension_cache: dict[str, str] = {}
+
             self.logger.info(
                 f"LanguageMapper initialized with {len(self.extension_to_language)} extension mappings and {len(self.filename_to_language)} filename mappings"
             )
@@ -332,23 +335,29 @@ class LanguageMapper:
             if not extension.startswith("."):
                 extension = "." + extension
 
+            cached = self._extension_cache.get(extension)
+            if cached is not None:
+                return cached
+
             # Check direct mapping
-            if extension in self.extension_to_language:
-                language = self.extension_to_language[extension]
+            language = self.extension_to_language.get(extension)
+            if language is not None:
                 self.logger.debug(
                     f"Mapped extension '{extension}' to language '{language}'"
                 )
-                return language
-
-            # Check aliases
-            for aliased_language, aliases in self.language_aliases.items():
-                if extension in aliases:
-                    self.logger.debug(
-                        f"Mapped extension '{extension}' to language '{aliased_language}'"
-                    )
-                    return aliased_language
-
-            return "Unknown"
+            else:
+                # Check aliases
+                language = "Unknown"
+                for aliased_language, aliases in self.language_aliases.items():
+                    if extension in aliases:
+                        self.logger.debug(
+                            f"Mapped extension '{extension}' to language '{aliased_language}'"
+                        )
+                        language = aliased_language
+                        break
+
+            self._extension_cache[extension] = language
+            return language
 
         except (TypeError, AttributeError, KeyError) as e:
             self.logger.error(f"Error mapping extension '{extension}' to language: {e}")
@@ -373,8 +382,8 @@ class LanguageMapper:
             basename = os.path.basename(filename)
 
             # Check special filenames
-            if basename in self.filename_to_language:
-                language = self.filename_to_language[basename]
+            language = self.filename_to_language.get(basename)
+            if language is not None:
                 self.logger.debug(
                     f"Mapped filename '{basename}' to language '{language}'"
                 )
@@ -404,7 +413,7 @@ class LanguageMapper:
             languages.update(self.filename_to_language.values())
 
             # Add aliased languages
-            languages.update(self.language_aliases.keys())
+            languages.update(self.language_aliases)
 
             supported_languages = sorted(languages)
             self.logger.debug(
@@ -4,9 +4,11 @@ Repository Statistics Processing Script
 Processes git fame statistics for a single repository and saves results.
 """
 
+import heapq
 import json
 import subprocess
 import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -125,13 +127,8 @@ def generate_language_svg_bar_chart(
             logger.warning("No language stats provided for SVG generation")
             return
 
-        # Sort languages by LOC
-        sorted_languages = sorted(
-            language_stats.items(), key=lambda x: x[1], reverse=True
-        )
-
-        # Take top 10 languages
-        top_languages = sorted_languages[:10]
+        # Take top 10 languages by LOC
+        top_languages = heapq.nlargest(10, language_stats.items(), key=itemgetter(1))
 
         if not top_languages:
             logger.warning("No valid language data for SVG generation")
@@ -258,13 +255,10 @@ def main() -> None:
         repo_dir = Path(__file__).parent.parent / "repo"
         analyzer = DependencyAnalyzer()
         tech_stack = analyzer.analyze_repository_dependencies(repo_dir)
-        tech_stack_serializable = {}
-        for category, techs in tech_stack.items():
-            tech_list = sorted(techs)
-            tech_stack_serializable[category] = {
-                "technologies": tech_list,
-                "count": len(tech_list),
-            }
+        tech_stack_serializable = {
+            cat: {"technologies": sorted(techs), "count": len(techs)}
+            for cat, techs in tech_stack.items()
+        }
         with open("tech_stack_analysis.json", "w", encoding="utf-8") as f:
             json.dump(tech_stack_serializable, f, indent=2, ensure_ascii=False)
     except KeyboardInterrupt:
@@ -806,8 +806,8 @@ class JSONReportGenerator:
                 "CSS": "CSS, TailwindCSS",
             }
             for lang, stats in language_stats.items():
-                if lang in lang_to_tech:
-                    tech_name = lang_to_tech[lang]
+                tech_name = lang_to_tech.get(lang)
+                if tech_name is not None:
                     loc = stats.get("loc", 0)
                     if lang in ["TypeScript", "JavaScript", "HTML", "CSS"]:
                         frontend_techs = categories["frontend"]["technologies"]
@@ -860,12 +860,9 @@ class JSONReportGenerator:
             }
             programming_languages = 0
             if stats.unified_language_stats:
+                # Key-view set difference; no intermediate list is built
                 programming_languages = len(
-                    [
-                        lang
-                        for lang in stats.unified_language_stats.keys()
-                        if lang not in excluded_categories
-                    ]
+                    stats.unified_language_stats.keys() - excluded_categories
                 )
             complexity = {
                 "project_scale": {
@@ -944,12 +941,9 @@ class JSONReportGenerator:
             }
             programming_languages = 0
             if stats.unified_language_stats:
+                # Key-view set difference; no intermediate list is built
                 programming_languages = len(
-                    [
-                        lang
-                        for lang in stats.unified_language_stats.keys()
-                        if lang not in excluded_categories
-                    ]
+                    stats.unified_language_stats.keys() - excluded_categories
                 )
             if stats.guillermo_unified.commits > 100:
                 insights["strengths"].append(
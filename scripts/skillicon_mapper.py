@@ -717,6 +717,50 @@ class SkilliconMapper:
             "activitypub": "activitypub",
         }
 
+        # Flat views built once; later tables win on duplicate names, as the
+        # per-call merges they replace did
+        self.all_mappings: dict[str, str] = {
+            **self.frontend_mappings,
+            **self.backend_mappings,
+            **self.database_mappings,
+            **self.devops_mappings,
+            **self.ai_ml_mappings,
+            **self.tools_mappings,
+            **self.package_mappings,
+            **self.social_mappings,
+        }
+        # Case-insensitive lookup: first name (in merge order) whose ID is valid
+        self._valid_ids_by_lower_name: dict[str, str] = {}
+        # Reverse lookup: first original name mapped to each skillicon ID
+        self._original_names_by_id: dict[str, str] = {}
+        for name, skillicon_id in self.all_mappings.items():
+            if skillicon_id in VALID_SKILLICONS:
+                self._valid_ids_by_lower_name.setdefault(name.lower(), skillicon_id)
+            self._original_names_by_id.setdefault(skillicon_id, name)
+        # Each category table with its keys lowercased once, instead of on
+        # every lookup; unknown categories fall back to the merged table
+        self._category_tables = {
+            category: self._with_lowered_keys(mapping)
+            for category, mapping in (
+                ("frontend", self.frontend_mappings),
+                ("backend", self.backend_mappings),
+                ("database", self.database_mappings),
+                ("devops", self.devops_mappings),
+                ("ai_ml", self.ai_ml_mappings),
+            )
+        }
+        self._all_table = self._with_lowered_keys(self.all_mappings)
+
+    @staticmethod
+    def _with_lowered_keys(
+        mapping: dict[str, str],
+    ) -> tuple[dict[str, str], dict[str, str], tuple[str, ...]]:
+        """Return (mapping, first value per lowercased key, lowercased keys)."""
+        first_by_lower: dict[str, str] = {}
+        for key, value in mapping.items():
+            first_by_lower.setdefault(key.lower(), value)
+        return mapping, first_by_lower, tuple(first_by_lower)
+
     def map_technologies(
         self, tech_stack: dict[str, dict[str, list[str]]]
     ) -> dict[str, dict[str, list[str]]]:
@@ -732,41 +776,9 @@ class SkilliconMapper:
         mapped_stack = {}
 
         for category, data in tech_stack.items():
-            if category == "frontend":
-                mapped_techs = self._map_category(
-                    data.get("technologies", []), self.frontend_mappings
-                )
-            elif category == "backend":
-                mapped_techs = self._map_category(
-                    data.get("technologies", []), self.backend_mappings
-                )
-            elif category == "database":
-                mapped_techs = self._map_category(
-                    data.get("technologies", []), self.database_mappings
-                )
-            elif category == "devops":
-                mapped_techs = self._map_category(
-                    data.get("technologies", []), self.devops_mappings
-                )
-            elif category == "ai_ml":
-                mapped_techs = self._map_category(
-                    data.get("technologies", []), self.ai_ml_mappings
-                )
-            else:
-                # Try all mappings for unknown categories
-                all_mappings = {
-                    **self.frontend_mappings,
-                    **self.backend_mappings,
-                    **self.database_mappings,
-                    **self.devops_mappings,
-                    **self.ai_ml_mappings,
-                    **self.tools_mappings,
-                    **self.package_mappings,
-                    **self.social_mappings,
-                }
-                mapped_techs = self._map_category(
-                    data.get("technologies", []), all_mappings
-                )
+            # Try all mappings for unknown categories
+            table = self._category_tables.get(category, self._all_table)
+            mapped_techs = self._map_category(data.get("technologies", []), *table)
 
             # Only include categories that have valid technologies
             if mapped_techs:
@@ -778,7 +790,11 @@ class SkilliconMapper:
         return mapped_stack
 
     def _map_category(
-        self, technologies: list[str], mapping: dict[str, str]
+        self,
+        technologies: list[str],
+        mapping: dict[str, str],
+        first_by_lower: dict[str, str],
+        lower_keys: tuple[str, ...],
     ) -> list[str]:
         """
         Map a list of technologies to skillicon IDs.
@@ -786,6 +802,8 @@ class SkilliconMapper:
         Args:
             technologies: List of technology names
             mapping: Dictionary mapping technology names to skillicon IDs
+            first_by_lower: First skillicon ID for each lowercased mapping key
+            lower_keys: Distinct lowercased mapping keys
 
         Returns:
             List of valid skillicon IDs
@@ -794,22 +812,20 @@ class SkilliconMapper:
 
         for tech in technologies:
             # Try exact match first
-            if tech in mapping:
-                skillicon_id = mapping[tech]
+            skillicon_id = mapping.get(tech)
+            if skillicon_id is not None:
                 if skillicon_id in VALID_SKILLICONS:
                     mapped_techs.add(skillicon_id)
                 continue
 
             # Try case-insensitive match
             tech_lower = tech.lower()
-            for key, value in mapping.items():
-                if key.lower() == tech_lower:
-                    if value in VALID_SKILLICONS:
-                        mapped_techs.add(value)
-                    break
+            value = first_by_lower.get(tech_lower)
+            if value is not None and value in VALID_SKILLICONS:
+                mapped_techs.add(value)
 
             # Try partial match for common patterns
-            if not any(key.lower() in tech_lower for key in mapping):
+            if not any(key in tech_lower for key in lower_keys):
                 # Check if the tech name itself is a valid skillicon
                 if tech in VALID_SKILLICONS:
                     mapped_techs.add(tech)
@@ -826,24 +842,7 @@ class SkilliconMapper:
         Returns:
             The original dependency name or None if not found
         """
-        # Check all mappings for the skillicon ID
-        all_mappings = {
-            **self.frontend_mappings,
-            **self.backend_mappings,
-            **self.database_mappings,
-            **self.devops_mappings,
-            **self.ai_ml_mappings,
-            **self.tools_mappings,
-            **self.package_mappings,
-            **self.social_mappings,
-        }
-
-        # Find the original dependency name
-        for orig_name, mapped_id in all_mappings.items():
-            if mapped_id == skillicon_id:
-                return orig_name
-
-        return None
+        return self._original_names_by_id.get(skillicon_id)
 
     def get_skillicon_id(self, dependency_name: str) -> str | None:
         """
@@ -855,32 +854,13 @@ class SkilliconMapper:
         Returns:
             The skillicon ID or None if not found
         """
-        # Check all mappings for the dependency name
-        all_mappings = {
-            **self.frontend_mappings,
-            **self.backend_mappings,
-            **self.database_mappings,
-            **self.devops_mappings,
-            **self.ai_ml_mappings,
-            **self.tools_mappings,
-            **self.package_mappings,
-            **self.social_mappings,
-        }
-
         # Try exact match first
-        if dependency_name in all_mappings:
-            skillicon_id = all_mappings[dependency_name]
-            if skillicon_id in VALID_SKILLICONS:
-                return skillicon_id
+        skillicon_id = self.all_mappings.get(dependency_name)
+        if skillicon_id in VALID_SKILLICONS:
+            return skillicon_id
 
         # Try case-insensitive match
-        dependency_lower = dependency_name.lower()
-        for key, value in all_mappings.items():
-            if key.lower() == dependency_lower:
-                if value in VALID_SKILLICONS:
-                    return value
-
-        return None
+        return self._valid_ids_by_lower_name.get(dependency_name.lower())
 
     def get_mapping_summary(
         self, tech_stack: dict[str, dict[str, list[str]]]
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests for the manifest parsers and classifiers of dependency_analyzer
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Local modules import each other by bare name
+sys.path.insert(0, str(Path(__file__).parent))
+
+from dependency_analyzer import (  # noqa: E402
+    BACKEND,
+    DATABASE,
+    DEVOPS,
+    FRONTEND,
+    DependencyAnalyzer,
+    _parse_cargo_toml,
+    _parse_pom_xml,
+    pyproject_dependency_names,
+    pyproject_pins,
+    requirement_names,
+    requirement_pins,
+)
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("requests==2.31.0", [("requests", "2.31.0")]),
+        ("Flask[async,dotenv]>=2.3", [("flask", "2.3")]),
+        ("uvicorn [standard] ~= 0.23", [("uvicorn", "0.23")]),
+        ("legacy-pkg===1.0+local", [("legacy-pkg", "1.0+local")]),
+        ('numpy<2; python_version < "3.12"', [("numpy", "2")]),
+        ("pydantic>=2 # pinned for v2 API", [("pydantic", "2")]),
+        ("Django_Rest.Framework", [("django_rest.framework", "")]),
+    ],
+)
+def test_requirement_pins_parses_one_line(line, expected):
+    assert requirement_pins(line.encode()) == expected
+
+
+def test_requirement_pins_skips_comments_and_options():
+    content = (
+        b"# core\n"
+        b"-r base.txt\n"
+        b"--index-url https://example.org/simple\n"
+        b"-e git+https://example.org/repo.git#egg=local\n"
+        b"  fastapi==0.110.0 \\\n"
+        b"    --hash=sha256:abc\n"
+        b"\n"
+        b"httpx>=0.27\n"
+    )
+    assert requirement_pins(content) == [("fastapi", "0.110.0"), ("httpx", "0.27")]
+
+
+def test_requirement_names_matches_pins():
+    text = "Flask[async]>=2\n# comment\nSQLAlchemy ; extra == 'db'\n"
+    assert requirement_names(text) == ["flask", "sqlalchemy"]
+
+
+def test_pyproject_pins_reads_pep621_and_poetry_specs():
+    data = {
+        "project": {
+            "dependencies": ["Requests[socks]>=2.31; python_version >= '3.9'"],
+            "optional-dependencies": {"db": ["SQLAlchemy~=2.0"]},
+        },
+        "tool": {
+            "poetry": {
+                "dependencies": {
+                    "python": "^3.11",
+                    "fastapi": "^0.110",
+                    "django": {"version": "^4.2", "extras": ["bcrypt"]},
+                    "numpy": [
+                        {"version": "<1.25", "python": "<3.9"},
+                        {"version": ">=1.25", "python": ">=3.9"},
+                    ],
+                    "local-lib": {"path": "../lib"},
+                },
+                "group": {"dev": {"dependencies": {"pytest": "^8"}}},
+            }
+        },
+    }
+    assert pyproject_pins(data) == [
+        ("requests", "2.31"),
+        ("sqlalchemy", "2.0"),
+        ("python", "^3.11"),
+        ("fastapi", "^0.110"),
+        ("django", "^4.2"),
+        ("numpy", "<1.25"),
+        ("local-lib", ""),
+        ("pytest", "^8"),
+    ]
+    # Names feed classification, where python reports the language
+    assert "python" in pyproject_dependency_names(data)
+
+
+def test_python_dependencies_schema_skips_poetry_python(tmp_path):
+    (tmp_path / "requirements.txt").write_text("flask==3.0\nrequests>=2\n")
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.poetry.dependencies]\n"
+        'python = "^3.11"\n'
+        'requests = {version = "^2.32"}\n'
+    )
+    result = DependencyAnalyzer().analyze_python_dependencies(str(tmp_path))
+    requirements = str(tmp_path / "requirements.txt")
+    pyproject = str(tmp_path / "pyproject.toml")
+    # Later files win, and every declaring file is listed
+    assert result == {
+        "packages": {"flask": "3.0", "requests": "^2.32"},
+        "sources": {"flask": [requirements], "requests": [requirements, pyproject]},
+    }
+
+
+def test_malformed_pyproject_keeps_other_files(tmp_path):
+    (tmp_path / "requirements.txt").write_text("flask==3.0\n")
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry]\ngroup = "dev"\n')
+    result = DependencyAnalyzer().analyze_python_dependencies(str(tmp_path))
+    assert result["packages"] == {"flask": "3.0"}
+
+
+def test_cargo_toml_reads_plain_and_dotted_keys(tmp_path):
+    cargo = tmp_path / "Cargo.toml"
+    cargo.write_text(
+        "[package]\n"
+        'name = "svc"\n'
+        "\n"
+        "[dependencies]\n"
+        "# runtime\n"
+        'tokio = { version = "1", features = ["full"] }\n'
+        "serde.workspace = true\n"
+        'axum = "0.7"\n'
+        "\n"
+        "[dev-dependencies]\n"
+        'criterion = "0.5"\n'
+    )
+    assert _parse_cargo_toml(str(cargo)) == ("tokio", "serde", "axum")
+
+
+def test_pom_xml_reads_namespaced_artifacts(tmp_path):
+    pom = tmp_path / "pom.xml"
+    pom.write_text(
+        '<project xmlns="http://maven.apache.org/POM/4.0.0">'
+        "<artifactId>app</artifactId>"
+        "<dependencies>"
+        "<dependency><groupId>org.springframework.boot</groupId>"
+        "<artifactId> spring-boot-starter-web </artifactId></dependency>"
+        "<dependency><groupId>org.postgresql</groupId>"
+        "<artifactId>postgresql</artifactId></dependency>"
+        "</dependencies>"
+        "</project>"
+    )
+    assert _parse_pom_xml(str(pom)) == ("spring-boot-starter-web", "postgresql")
+
+    techs = DependencyAnalyzer().analyze_repository_dependencies(tmp_path)
+    assert "java" in techs["backend"]
+    assert "postgres" in techs["database"]
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("@radix-ui/react-dialog", (FRONTEND, "Radix UI")),
+        ("@aws-sdk/client-s3", (DEVOPS, "AWS")),
+        ("@prisma/client", (DATABASE, "Prisma")),
+        # Scopes match case-insensitively
+        ("@Vue/compiler-sfc", (FRONTEND, "Vue.js")),
+        ("@unknown/pkg", None),
+        ("radix-ui", None),
+        # Exact entries cover scopes without a rule
+        ("@types/react", (FRONTEND, "React")),
+    ],
+)
+def test_classify_dependency_scope_rules(name, expected):
+    assert DependencyAnalyzer().classify_dependency(name) == expected
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("python-dotenv", (BACKEND, "Python dotenv")),
+        ("python_dotenv", (BACKEND, "Python dotenv")),
+        ("Python.DotEnv", (BACKEND, "Python dotenv")),
+        ("bcrypt", (BACKEND, "bcrypt")),
+        ("ioredis", (DATABASE, "Redis")),
+    ],
+)
+def test_classify_python_dependency_normalizes_names(name, expected):
+    assert DependencyAnalyzer().classify_python_dependency(name) == expected
@@ -8,6 +8,7 @@ import os
 import re
 import subprocess
 import sys
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +19,17 @@ from error_handling import DataProcessingError, get_logger, log_and_raise
 # Set up logging for this module
 logger = get_logger(__name__)
 
+# A requirement line: package name and version spec, or any other
+# non-comment text, which is reported as invalid
+REQUIREMENT_LINE_PATTERN = re.compile(
+    r"^[ \t]*(?:([a-zA-Z0-9_-]+)([^\n]*)|([^#\s][^\n]*))", re.MULTILINE
+)
+
+# Directories never searched for Python sources when scanning imports
+SCAN_SKIP_DIRS = frozenset(
+    {"__pycache__", ".git", "venv", ".venv", "node_modules", "build", "dist"}
+)
+
 
 @dataclass
 class PackageInfo:
@@ -79,6 +91,7 @@ class DependencyManager:
                 "colorama": "colorama",
                 "tqdm": "tqdm",
                 "git-fame": "git_fame",
+                "orjson": "orjson",
             },
         )
 
@@ -167,7 +180,7 @@ class DependencyManager:
                 lines = stdout.split("\n")
                 for line in lines:
                     if "LATEST:" in line:
-                        version = line.split("LATEST:")[1].strip()
+                        version = line.partition("LATEST:")[2].strip()
                         if version and version != "999.999.999":
                             return version
                     # Also check for version in parentheses
@@ -203,7 +216,7 @@ class DependencyManager:
                 # Look for version in pip show output
                 for line in stdout.split("\n"):
                     if line.startswith("Version:"):
-                        version = line.split(":", 1)[1].strip()
+                        version = line.partition(":")[2].strip()
                         if version and version != "999.999.999":
                             return version
 
@@ -247,19 +260,18 @@ class DependencyManager:
                 return []
 
             with open(self.requirements_file, encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        # Parse package name and version spec
-                        match = re.match(r"^([a-zA-Z0-9_-]+)(.*)$", line)
-                        if match:
-                            package = match.group(1)
-                            version_spec = match.group(2).strip()
-                            requirements.append((package, version_spec))
-                        else:
-                            self.logger.warning(
-                                f"Invalid requirement format at line {line_num}: {line}"
-                            )
+                content = f.read()
+            # One pass over the whole text; blank and comment lines never match
+            for match in REQUIREMENT_LINE_PATTERN.finditer(content):
+                package, version_spec, invalid = match.groups()
+                if package:
+                    requirements.append((package, version_spec.strip()))
+                else:
+                    line_num = content.count("\n", 0, match.start()) + 1
+                    self.logger.warning(
+                        f"Invalid requirement format at line {line_num}: "
+                        f"{invalid.rstrip()}"
+                    )
 
         except Exception as e:
             log_and_raise(
@@ -275,13 +287,10 @@ class DependencyManager:
     def scan_code_for_imports(self) -> set[str]:
         """Scan Python files for import statements to find used dependencies."""
         used_packages = set()
-        scripts_dir = Path(__file__).parent
+        scripts_dir = os.path.dirname(os.path.abspath(__file__))
 
         try:
-            for py_file in scripts_dir.rglob("*.py"):
-                if py_file.name == "__pycache__":
-                    continue
-
+            for py_file in self._iter_python_files(scripts_dir):
                 with open(py_file, encoding="utf-8") as f:
                     content = f.read()
 
@@ -296,7 +305,7 @@ class DependencyManager:
                         matches = re.findall(pattern, content)
                         for match in matches:
                             # Extract the base package name
-                            base_package = match.split(".")[0]
+                            base_package = match.partition(".")[0]
                             used_packages.add(base_package)
 
         except Exception as e:
@@ -304,6 +313,24 @@ class DependencyManager:
 
         return used_packages
 
+    @staticmethod
+    def _iter_python_files(root: str) -> Iterator[str]:
+        """Yield the .py files under root, pruning cache and virtualenv trees."""
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                # Unreadable directories are skipped, as Path.rglob did
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SCAN_SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry.path
+
     def check_current_versions(
         self, requirements: list[tuple[str, str]]
     ) -> dict[str, str]:
@@ -319,7 +346,7 @@ class DependencyManager:
                     # Parse version from pip show output
                     for line in stdout.split("\n"):
                         if line.startswith("Version:"):
-                            version = line.split("Version:")[1].strip()
+                            version = line.partition("Version:")[2].strip()
                             current_versions[package] = version
                             break
                     else:
@@ -583,22 +610,27 @@ class DependencyManager:
     ) -> bool:
         """Update requirements.txt with new versions."""
         try:
-            with open(self.requirements_file, encoding="utf-8") as f:
-                content = f.read()
-
-            # Update each package version
+            # Determine the new version spec of each outdated package
+            new_specs = []
             for package_info in packages_info:
                 if package_info.current_version != package_info.latest_version:
-                    # Determine new version spec
                     if pin_versions or package_info.name in self.pin_exact_versions:
                         new_spec = f"{package_info.name}=={package_info.latest_version}"
                     else:
                         new_spec = f"{package_info.name}>={package_info.latest_version}"
+                    new_specs.append((package_info.name, new_spec))
 
-                    # Find and replace the version specification
-                    pattern = rf"^{package_info.name}.*$"
-                    replacement = new_spec
-                    content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
+            # Stream the file once, replacing the specification on matching lines
+            updated_lines = []
+            with open(self.requirements_file, encoding="utf-8") as f:
+                for line in f:
+                    body = line.rstrip("\r\n")
+                    ending = line[len(body) :]
+                    for name, new_spec in new_specs:
+                        if body.startswith(name):
+                            body = new_spec
+                    updated_lines.append(body + ending)
+            content = "".join(updated_lines)
 
             # Write back to file
             with open(self.requirements_file, "w", encoding="utf-8") as f: